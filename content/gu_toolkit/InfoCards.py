@@ -0,0 +1,140 @@
+"""
+InfoCards: Info components for SmartFigure sidebars
+===================================================
+
+Purpose
+-------
+Ready-made info components (see ``SmartFigure.add_info_component``) shared by the
+notebooks. Each factory returns a component class for specific functions.
+
+The cards are updated on every slider tick, so everything that does not depend on
+the slider values is done once in ``__init__``: the kernel is a
+:class:`~gu_toolkit.numpify.NumpifyHandle` (compiled on first use, not looked up in
+the numpify cache per tick) and the expressions are prepared with
+``fig.eval_context.key``, so the per-tick context lookups do not inspect them.
+
+Dependencies
+------------
+- ipywidgets, IPython (required)
+- NumPy, SymPy (required)
+
+Public API
+----------
+- :func:`SupNormCard`
+- :func:`MaxDistanceCard`
+- :func:`DistanceMetricsCard`
+"""
+
+from __future__ import annotations
+
+import ipywidgets as widgets
+import numpy as np
+import sympy as sp
+from IPython.display import clear_output, display
+
+from .norms import distance_metrics, sup_norm, trig_max_frequency
+from .numpify import NumpifyHandle
+
+
+__all__ = ["SupNormCard", "MaxDistanceCard", "DistanceMetricsCard"]
+
+
+def MaxDistanceCard(var: sp.Symbol, F: sp.Expr, G: sp.Expr) -> type:
+    """Info card with the largest distance ``max |F - G|`` on [-1/2, 1/2]."""
+    return SupNormCard(var, F - G)
+
+
+def SupNormCard(var: sp.Symbol, F: sp.Expr) -> type:
+    """
+    Info card with the sup norm ``max |F|`` on [-1/2, 1/2].
+
+    The maximum of a coarse grid (a plot grid from ``fig.eval_context`` if one covers
+    the interval densely enough) is refined by :func:`gu_toolkit.norms.sup_norm`.
+    """
+    class SupNormCard_for_specific_functions:
+        def __init__(self, out, fig):
+            # Coarse grid only: the maxima are refined by sup_norm.
+            self.xs = np.linspace(-0.5, 0.5, 257)
+
+            self.prefix = widgets.HTMLMath(
+                value=r"The largest distance between the two functions on "
+                      r"$\left[-\tfrac12,\tfrac12\right]$ is: "
+            )
+            self.value = widgets.HTML(value="<code>…</code>")
+            with out:
+                clear_output()
+                display(widgets.VBox([self.prefix, self.value]))
+            self.expr = sp.Abs(F)
+            self.var = var
+            self.params = tuple(sorted([s for s in self.expr.free_symbols if s != self.var], key=lambda s: s.sort_key()))
+            self.key = fig.eval_context.key(self.expr, self.var)
+            self.max_frequency = trig_max_frequency(self.expr, self.var)
+            self.kernel = NumpifyHandle(self.expr, args=[self.var] + list(self.params))
+            for p in self.params:
+                fig.add_param(p)
+
+        def update(self, change, fig, out):
+            par_vals = [fig.params[p].value for p in self.params]  # current slider values
+            xs, ys = fig.eval_context.evaluate_on_window(
+                self.key, self.var, (-0.5, 0.5), self.xs, min_points=400, values=dict(zip(self.params, par_vals))
+            )
+            sup = sup_norm(
+                lambda t: self.kernel(t, *par_vals), -0.5, 0.5, x=xs, y=ys, max_frequency=self.max_frequency
+            ).value
+            self.value.value = f"<code>{sup:g}</code>"
+    return SupNormCard_for_specific_functions
+
+
+def DistanceMetricsCard(var: sp.Symbol, F: sp.Expr, G: sp.Expr, modes: int = 5, points: int = 256) -> type:
+    """
+    Info card with several distances between ``F`` and ``G`` on [-1/2, 1/2]: the largest,
+    the average and the root-mean-square distance, and the error of the Fourier modes
+    ``1 .. modes`` (see :func:`gu_toolkit.norms.distance_metrics`).
+
+    ``F`` and ``G`` are evaluated once per update on one shared grid of ``points``
+    points (through ``fig.eval_context``, so a curve whose sliders did not move is not
+    evaluated again), and all metrics are computed from the same difference array.
+    """
+    class DistanceMetricsCard_for_specific_functions:
+        def __init__(self, out, fig):
+            # One period without its end point, as the FFT and the averages need; the
+            # midpoints avoid sampling jumps at 0 and ±1/2 exactly.
+            self.xs = np.linspace(-0.5, 0.5, points, endpoint=False) + 0.5 / points
+
+            self.prefix = widgets.HTMLMath(
+                value=r"Distances between the two functions on "
+                      r"$\left[-\tfrac12,\tfrac12\right]$: "
+            )
+            self.value = widgets.HTML(value="<code>…</code>")
+            with out:
+                clear_output()
+                display(widgets.VBox([self.prefix, self.value]))
+            self.F = sp.sympify(F)
+            self.G = sp.sympify(G)
+            self.var = var
+            # Parameters of F and G (a term shared by both may cancel in the difference).
+            symbols = (self.F.free_symbols | self.G.free_symbols) - {self.var}
+            self.params = tuple(sorted(symbols, key=lambda s: s.sort_key()))
+            self.max_frequency = trig_max_frequency(self.F - self.G, self.var)
+            self.kernel = NumpifyHandle(self.F - self.G, args=[self.var] + list(self.params))
+            self.keys = (fig.eval_context.key(self.F, self.var), fig.eval_context.key(self.G, self.var))
+            for p in self.params:
+                fig.add_param(p)
+
+        def update(self, change, fig, out):
+            ctx = fig.eval_context
+            par_vals = [fig.params[p].value for p in self.params]  # current slider values
+            values = dict(zip(self.params, par_vals))
+            f, g = (ctx.evaluate(k, self.var, self.xs, values=values) for k in self.keys)
+            m = distance_metrics(
+                lambda t: self.kernel(t, *par_vals), self.xs, f - g, -0.5, 0.5,
+                modes=modes, max_frequency=self.max_frequency,
+            )
+            mode_errors = ", ".join(f"{n}: {e:.3g}" for n, e in enumerate(m.mode_errors, start=1))
+            self.value.value = "<br>".join([
+                f"largest: <code>{m.sup:g}</code>",
+                f"average: <code>{m.l1:g}</code>",
+                f"root-mean-square: <code>{m.l2:g}</code>",
+                f"error per mode: <code>{mode_errors}</code>",
+            ])
+    return DistanceMetricsCard_for_specific_functions
@@ -17,7 +17,7 @@ This file defines two main ideas:
    - plots SymPy expressions by compiling them to NumPy via ``numpify_cached``,
    - supports interactive parameter sliders (via ``SmartFloatSlider``),
    - optionally provides an *Info* area (a stack of ``ipywidgets.Output`` widgets),
-   - re-renders automatically when you pan/zoom (throttled) or move a slider.
+   - re-renders automatically when you pan/zoom (beyond the overscan) or move a slider.
 
 The intended workflow is:
 
@@ -69,8 +69,12 @@ To avoid a "God Object," responsibilities are split via composition:
 - SmartFigure: The main coordinator/facade.
 - SmartFigureLayout: Handles all UI/Widget construction, CSS/JS injection, and layout logic.
 - ParameterManager: Handles slider creation, storage, and change hooks. Acts as a dict proxy.
-- InfoPanelManager: Handles the info sidebar and component registry.
+- InfoPanelManager: Handles the info sidebar and component registry (slow components
+  run deferred, after the plots are pushed).
 - SmartPlot: Handles the specific math-to-trace rendering logic.
+- RenderScheduler: Coalesces slider-driven renders to at most one per frame.
+- RenderStats: Rolling timings of the render phases (``fig.perf``).
+- EvaluationContext: Memo of evaluated curves shared by plots and info components.
 
 
 Logging / debugging
@@ -91,13 +95,23 @@ To limit output to just this module, set its logger level instead:
 Notes:
 - INFO render messages are rate-limited to ~1.0s.
 - DEBUG range messages (x_range/y_range) are rate-limited to ~0.5s.
+
+For timings, use ``fig.perf`` (rolling percentiles per plot, phase and hook; see
+:class:`RenderStats`) or ``fig.show_perf_hud()`` for a live table in the Info panel.
 """
 
+import asyncio
+import html
+import inspect
 import re
+import sys
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 import warnings
 import logging
-from typing import Any, Callable, Hashable, Optional, Sequence, Tuple, Union, Dict, Iterator
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Sequence, Tuple, Union, Dict, Iterator
 
 import ipywidgets as widgets
 import numpy as np
@@ -109,7 +123,8 @@ from sympy.core.symbol import Symbol
 
 # Internal imports (assumed to exist in the same package)
 from .InputConvert import InputConvert
-from .numpify import numpify_cached
+from .numpify import linear_decomposition, numpify_cached
+from .sampling import adaptive_sample, decimate_minmax
 from .SmartSlider import SmartFloatSlider
 
 
@@ -492,6 +507,7 @@ class ParameterManager:
     def __init__(self, render_callback: Callable[[str, Any], None], layout_box: widgets.Box) -> None:
         self._sliders: Dict[Symbol, SmartFloatSlider] = {}
         self._hooks: Dict[Hashable, Callable[[Dict, Any], Any]] = {}
+        self._hook_params: Dict[Hashable, frozenset] = {}  # hook id -> symbols it reads
         self._hook_counter: int = 0
         self._render_callback = render_callback
         self._layout_box = layout_box # The VBox where sliders live
@@ -537,7 +553,9 @@ class ParameterManager:
         """True if any parameters (sliders) have been created."""
         return len(self._sliders) > 0
 
-    def add_hook(self, callback: Callable, hook_id: Optional[Hashable] = None, fig: Any = None) -> Hashable:
+    def add_hook(
+        self, callback: Callable, hook_id: Optional[Hashable] = None, fig: Any = None, params: Optional[Sequence[Symbol]] = None
+    ) -> Hashable:
         """
         Register a parameter change hook. 
         The callback is run immediately on registration, with an empty change dict.
@@ -551,6 +569,9 @@ class ParameterManager:
         fig: SmartFigure
             The SmartFigure instance. Crucial for passing to the callback immediately
             so the hook can initialize.
+        params: list[sympy.Symbol], optional
+            Parameters the hook depends on. If given, the hook only runs when one of
+            them changed; otherwise it runs on every parameter change.
 
         Returns
         -------
@@ -561,6 +582,10 @@ class ParameterManager:
             self._hook_counter += 1
             hook_id = f"hook:{self._hook_counter}"
         self._hooks[hook_id] = callback
+        if params is not None:
+            self._hook_params[hook_id] = frozenset(params)
+        else:
+            self._hook_params.pop(hook_id, None)
         
         # Run immediately on registration
         try:
@@ -576,6 +601,17 @@ class ParameterManager:
     def get_hooks(self) -> Dict[Hashable, Callable]:
         return self._hooks
 
+    def get_hook_params(self, hook_id: Hashable) -> Optional[frozenset]:
+        """Parameters a hook was registered for (None: it depends on all of them)."""
+        return self._hook_params.get(hook_id)
+
+    def symbol_for(self, slider: Any) -> Optional[Symbol]:
+        """Return the parameter symbol controlled by ``slider`` (None if unknown)."""
+        for symbol, s in self._sliders.items():
+            if s is slider:
+                return symbol
+        return None
+
     # --- Dict-like Interface for Backward Compatibility ---
     # This allows `fig.params[symbol]` to work in user hooks.
     
@@ -656,10 +692,164 @@ class InfoPanelManager:
         return len(self._outputs) > 0
 
 
+_EXECUTOR: Optional[Executor] = None
+
+
+def _thread_executor() -> Optional[Executor]:
+    """Worker thread for ``compute`` of info components (None without threads, e.g. Pyodide).
+
+    Only numpify state is safe to share with it (see ``add_info_component``).
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None and sys.platform != "emscripten":
+        _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SmartFigure")
+    return _EXECUTOR
+
+
+def _computes(component: Any) -> bool:
+    """Whether an info component uses the ``compute``/``display`` protocol (both are needed)."""
+    return callable(getattr(component, "compute", None)) and callable(getattr(component, "display", None))
+
+
+def _is_deferred(component: Any) -> bool:
+    """Whether an info component asked to run after the plot push (see ``add_info_component``)."""
+    return (
+        _computes(component)
+        or bool(getattr(component, "deferred", False))
+        or inspect.iscoroutinefunction(getattr(component, "update", None))
+    )
+
+
+class _DeferredRunner:
+    """
+    Runs deferred info components on the event loop, at most one run per component.
+
+    Each request starts a new *generation* for its component and cancels the previous
+    run if it has not finished yet, so a slider drag never queues stale updates, and a
+    computed result is only displayed if no newer request arrived in the meantime.
+    Without a running event loop, components run immediately.
+    """
+
+    def __init__(self, record: Callable[[str, float], None]) -> None:
+        self._record = record
+        self._runs: Dict[str, Any] = {}  # key -> pending asyncio.Handle / asyncio.Task
+        self._generation: Dict[str, int] = {}
+
+    def submit(self, key: str, component: Any, change: Dict, fig: Any, out: widgets.Output) -> None:
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        previous = self._runs.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+        loop = _running_event_loop()
+        if loop is None:
+            self._run_now(component, change, fig, out)
+        elif _computes(component):
+            self._runs[key] = loop.create_task(self._compute_and_display(key, generation, component, fig, out))
+        elif inspect.iscoroutinefunction(component.update):
+            self._runs[key] = loop.create_task(self._await_update(key, generation, component, change, fig, out))
+        else:
+            self._runs[key] = loop.call_soon(self._update, key, generation, component, change, fig, out)
+
+    @staticmethod
+    def _run_now(component: Any, change: Dict, fig: Any, out: widgets.Output) -> None:
+        if _computes(component):
+            component.display(component.compute(_param_values(fig)), fig, out)
+        elif inspect.iscoroutinefunction(component.update):
+            asyncio.run(component.update(change, fig, out))
+        else:
+            component.update(change, fig, out)
+
+    def _done(self, key: str, generation: int, t: float) -> None:
+        if self._generation.get(key) == generation:
+            self._runs.pop(key, None)
+        self._record(f"{key}:deferred", time.perf_counter() - t)
+
+    def _update(self, key: str, generation: int, component: Any, change: Dict, fig: Any, out: widgets.Output) -> None:
+        t = time.perf_counter()
+        try:
+            component.update(change, fig, out)
+        except Exception as e:
+            warnings.warn(f"Hook {key} failed: {e}")
+        self._done(key, generation, t)
+
+    async def _await_update(
+        self, key: str, generation: int, component: Any, change: Dict, fig: Any, out: widgets.Output
+    ) -> None:
+        t = time.perf_counter()
+        try:
+            await component.update(change, fig, out)
+        except Exception as e:
+            warnings.warn(f"Hook {key} failed: {e}")
+        self._done(key, generation, t)
+
+    async def _compute_and_display(self, key: str, generation: int, component: Any, fig: Any, out: widgets.Output) -> None:
+        t = time.perf_counter()
+        values = _param_values(fig)  # snapshot: sliders may move while computing
+        try:
+            executor = _thread_executor()
+            if executor is None:
+                result = component.compute(values)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(executor, component.compute, values)
+            if self._generation.get(key) != generation:
+                return  # superseded; a newer run displays its own result
+            component.display(result, fig, out)
+        except Exception as e:
+            warnings.warn(f"Hook {key} failed: {e}")
+        self._done(key, generation, t)
+
+
+def _param_values(fig: Any) -> Dict[Symbol, float]:
+    return {symbol: slider.value for symbol, slider in fig.params.items()}
+
+
 # =============================================================================
 # SECTION: SmartPlot (The specific logic for one curve) [id: SmartPlot]
 # =============================================================================
 
+class _RenderCache:
+    """Byte-bounded LRU of array tuples (e.g. pushed ``(x, y)`` trace data), keyed by render state."""
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, ...]]" = OrderedDict()
+        self.nbytes = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, ...]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: Tuple[np.ndarray, ...], max_bytes: int) -> None:
+        size = sum(a.nbytes for a in entry)
+        if size > max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= sum(a.nbytes for a in old)
+        self._entries[key] = entry
+        self.nbytes += size
+        self.shrink(max_bytes)
+
+    def shrink(self, max_bytes: int) -> None:
+        """Evict least recently used entries until at most ``max_bytes`` are held."""
+        while self.nbytes > max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= sum(a.nbytes for a in old)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def keys(self) -> list:
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class SmartPlot:
     """
     A single plotted curve managed by a :class:`SmartFigure`.
@@ -671,8 +861,38 @@ class SmartPlot:
     - sample x-values on an appropriate domain,
     - evaluate y-values (including current slider parameter values),
     - push the sampled data into the Plotly trace.
+
+    Full-resolution evaluations on uniform grids are also stored in the figure's
+    :class:`EvaluationContext`, so info components can reuse them.
+
+    If the expression is linear in its parameters (see ``linear_decomposition``),
+    repeated renders on the same x grid (slider drags) are computed as
+    ``offset + params @ basis`` from per-grid basis columns instead of calling the
+    compiled function again, so their cost no longer grows with the number of
+    transcendental terms.
+
+    Before the samples are pushed to the trace they are reduced to the minimum and
+    maximum per pixel column of the viewport (see ``decimate_minmax``), so large
+    ``sampling_points`` never ship more points than can be drawn.
+
+    The sampled window extends ``SmartFigure.overscan`` viewport widths beyond each
+    side of the view, so small pans are served by data already in the trace.
+
+    Expensive plots can render *progressively* during slider drags: a coarse preview
+    (``1/8`` of the points) is pushed right away and the full resolution follows once
+    the parameters have settled (see ``SmartFigure.progressive``).
     """
 
+    # Largest basis (parameters x samples) kept for the linear fast path.
+    _LINEAR_BASIS_MAX_ELEMENTS = 2**22
+    # Assumed plot width (pixels) for decimation while the figure autosizes.
+    _DEFAULT_PIXEL_WIDTH = 1000
+    # Zoom factors (rendered / current view width) that still count as "same zoom".
+    _ZOOM_TOLERANCE = (0.8, 1.25)
+    # Progressive rendering: preview resolution (fraction of the points, lower bound).
+    _PREVIEW_FACTOR = 8
+    _PREVIEW_MIN_POINTS = 64
+
     def __init__(
         self,
         var: Symbol,
@@ -683,6 +903,8 @@ class SmartPlot:
         sampling_points: Optional[int,str] = None,
         label: str = "",
         visible: VisibleSpec = True,
+        adaptive_sampling: Optional[Union[bool, str]] = None,
+        progressive: Optional[Union[bool, str]] = None,
     ) -> None:
         """
         Create a new SmartPlot instance. (Usually called by SmartFigure.plot)
@@ -693,6 +915,31 @@ class SmartPlot:
         self._smart_figure.figure_widget.add_scatter(x=[], y=[], mode="lines", name=label, visible=visible)
         self._plot_handle = self._smart_figure.figure_widget.data[-1]
 
+        # Reused across frames: the compiled function writes y-values into it and
+        # Plotly copies the data on assignment.
+        self._y_buffer: Optional[np.ndarray] = None
+        # Last x array pushed to the trace (never mutated afterwards).
+        self._sent_x: Optional[np.ndarray] = None
+
+        # Linear-in-parameters fast path: (offset, basis) on the grid ``_basis_key``.
+        self._linear = False
+        self._basis: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._basis_key: Optional[Tuple[float, float, int]] = None
+        self._last_grid_key: Optional[Tuple[float, float, int]] = None
+
+        # Pushed (x, y) per render state; bounded by ``SmartFigure.render_cache_bytes``.
+        self._render_cache = _RenderCache()
+        # (x_min, x_max, view width) of the data currently in the trace.
+        self._rendered_window: Optional[Tuple[float, float, float]] = None
+
+        # Progressive rendering: smoothed duration of full-resolution evaluations, and
+        # whether the trace currently shows a coarse preview.
+        self._eval_seconds: Optional[float] = None
+        self._needs_refine = False
+
+        # Phase durations (seconds) of the last render, collected by ``SmartFigure.perf``.
+        self._timings: Dict[str, float] = {}
+
         self._suspend_render = True
         self.set_func(var, func, parameters)
         self.x_domain = x_domain
@@ -700,6 +947,8 @@ class SmartPlot:
         if sampling_points == "figure_default":
             sampling_points = None
         self.sampling_points = sampling_points
+        self.adaptive_sampling = adaptive_sampling
+        self.progressive = progressive
 
         self._suspend_render = False
         
@@ -709,10 +958,20 @@ class SmartPlot:
         """
         Set the independent variable and symbolic function for this plot.
         Triggers recompilation via ``numpify_cached``.
+
+        The plot is compiled with common-subexpression elimination, the trigonometric
+        sum fast path (``fourier``) and in workspace mode (ufunc ``out=`` buffers), since
+        it is re-evaluated on every slider tick.
         """
         parameters = list(parameters) 
         # Compile
-        self._f_numpy = numpify_cached(func, args=[var] + parameters)
+        self._f_numpy = numpify_cached(func, args=[var] + parameters, cse=True, fourier=True, workspace=True)
+        self._linear = bool(parameters) and linear_decomposition(func, parameters) is not None
+        self._smart_figure._param_index = None  # parameter -> plot index is stale
+        self._basis = None
+        self._basis_key = None
+        self._render_cache.clear()
+        self._eval_seconds = None
         # Store
         self._var = var
         self._parameters = parameters
@@ -753,6 +1012,28 @@ class SmartPlot:
         self._sampling_points = int(InputConvert(value, int)) if value is not None else None
         self.render()
 
+    @property
+    def adaptive_sampling(self) -> Optional[bool]:
+        """Per-plot adaptive sampling switch (None: use the figure default)."""
+        return self._adaptive_sampling
+
+    @adaptive_sampling.setter
+    def adaptive_sampling(self, value: Optional[Union[bool, str]]) -> None:
+        self._adaptive_sampling = None if value is None or value == "figure_default" else bool(value)
+        self.render()
+
+    @property
+    def progressive(self) -> Optional[Union[bool, str]]:
+        """Per-plot progressive rendering mode: True, False, "auto" or None (figure default)."""
+        return self._progressive
+
+    @progressive.setter
+    def progressive(self, value: Optional[Union[bool, str]]) -> None:
+        if value is None or value == "figure_default":
+            self._progressive = None
+        else:
+            self._progressive = SmartFigure._check_progressive(value)
+
     @property
     def visible(self) -> VisibleSpec:
         return self._plot_handle.visible
@@ -763,42 +1044,189 @@ class SmartPlot:
         if value is True:
             self.render()
 
-    def render(self) -> None:
+    def render(self, preview: bool = False) -> None:
         """
         Compute (x, y) samples and update the Plotly trace.
         Skips computation if the plot is hidden.
+
+        Pushed data is remembered per render state (sampled range, viewport, sampling
+        settings and this plot's parameter values) in a small LRU, so revisiting a
+        state (dragging a slider back, resetting it) costs a lookup. Uniform grids also
+        keep their full-resolution samples there, so a cache hit still leaves them in
+        ``fig.eval_context`` for the info components.
+
+        With ``preview=True`` a coarse grid is evaluated instead (unless the full
+        result is cached) and the plot is marked for refinement.
+
+        The durations of the phases (``sample``, ``eval``, ``decimate``, ``push``) are
+        left in ``_timings``.
         """
+        self._timings = {}
         if self._suspend_render or self.visible is not True:
             return
+        t = time.perf_counter()
 
-        # 1. Determine Range
+        # 1. Determine Range (viewport plus overscan on both sides)
         fig = self._smart_figure
         viewport = fig.current_x_range or fig.x_range
+        view_span = float(viewport[1]) - float(viewport[0])
+        pad = fig.overscan * view_span
         
         if self.x_domain is None:
-            x_min, x_max = float(viewport[0]), float(viewport[1])
+            x_min, x_max = float(viewport[0]) - pad, float(viewport[1]) + pad
         else:
-            x_min = min(float(viewport[0]), float(self.x_domain[0]))
-            x_max = max(float(viewport[1]), float(self.x_domain[1]))
+            x_min = min(float(viewport[0]) - pad, float(self.x_domain[0]))
+            x_max = max(float(viewport[1]) + pad, float(self.x_domain[1]))
+
+        # 2. Determine Sampling (the point density of the visible part is unchanged)
+        num = int(round(int(self.sampling_points or fig.sampling_points or 500) * (1 + 2 * fig.overscan)))
+        param_values = [fig.params.get_value(p) for p in self._parameters]
+        adaptive = self._adaptive_sampling if self._adaptive_sampling is not None else fig.adaptive_sampling
+        pixel_width = int(fig.figure_widget.layout.width or self._DEFAULT_PIXEL_WIDTH)
+        dtype = np.float32 if fig.transport == "float32" else np.float64
+
+        # Ranges are quantized (float32) so re-reported identical views hit the cache.
+        cache_key = (
+            float(np.float32(x_min)), float(np.float32(x_max)),
+            float(np.float32(viewport[0])), float(np.float32(viewport[1])),
+            num, bool(adaptive), pixel_width, fig.transport, tuple(param_values),
+        )
+        self._rendered_window = (x_min, x_max, view_span)
+        cached = self._render_cache.get(cache_key) if fig.render_cache_bytes > 0 else None
+        if cached is not None:
+            if len(cached) == 3:
+                x_full = np.linspace(x_min, x_max, num=num)
+                if fig.eval_context.lookup(self._func, self._var, x_full) is None:
+                    fig.eval_context.store(self._func, self._var, x_full, cached[2])
+            t = self._lap("sample", t)
+            self._push(cached[0], cached[1])
+            self._lap("push", t)
+            self._needs_refine = False
+            return
+
+        if preview:
+            # Coarse preview: own small grid, no buffer/basis/cache (the full render
+            # follows shortly).
+            n = max(self._PREVIEW_MIN_POINTS, num // self._PREVIEW_FACTOR)
+            x_values = np.linspace(x_min, x_max, num=min(num, n))
+            t = self._lap("sample", t)
+            y_values = np.broadcast_to(self._f_numpy(x_values, *param_values), x_values.shape)
+            t = self._lap("eval", t)
+            self._push(np.asarray(x_values, dtype=dtype), np.asarray(np.real(y_values), dtype=dtype))
+            self._lap("push", t)
+            self._needs_refine = True
+            return
 
-        # 2. Determine Sampling
-        num = self.sampling_points or fig.sampling_points or 500
-        
         # 3. Compute
-        x_values = np.linspace(x_min, x_max, num=int(num))
-        args = [x_values]
-        if self._parameters:
-            # Retrieve values from the manager
-            for p in self._parameters:
-                args.append(fig.params.get_value(p))
-        
-        y_values = np.asarray(self._f_numpy(*args))
-        
-        # 4. Update Trace
-        with fig.figure_widget.batch_update():
-            self._plot_handle.x = x_values
-            self._plot_handle.y = y_values
+        if adaptive:
+            # Non-uniform grid that depends on the parameters: no buffer/basis reuse.
+            y_range = fig.current_y_range or fig.y_range
+            t = self._lap("sample", t)
+            x_values, y_values = adaptive_sample(
+                lambda xs: self._f_numpy(xs, *param_values), x_min, x_max, num,
+                y_scale=abs(float(y_range[1]) - float(y_range[0])),
+            )
+            self._last_grid_key = None
+        else:
+            x_values = np.linspace(x_min, x_max, num=num)
+            args = [x_values, *param_values]
+
+            if self._y_buffer is None or self._y_buffer.shape != x_values.shape:
+                self._y_buffer = np.empty(x_values.shape)
+            t = self._lap("sample", t)
+
+            # The basis is only built once the grid is reused (i.e. on the second render
+            # without pan/zoom), so panning never pays for it.
+            grid_key = (x_min, x_max, num)
+            if (
+                self._linear
+                and grid_key == self._last_grid_key
+                and len(self._parameters) * x_values.size <= self._LINEAR_BASIS_MAX_ELEMENTS
+            ):
+                y_values = self._render_linear(x_values, args[1:], grid_key)
+            else:
+                y_values = self._f_numpy(*args, out=self._y_buffer)
+            self._last_grid_key = grid_key
+        t = self._lap("eval", t)
+        t_eval = self._timings["eval"]
+        self._eval_seconds = t_eval if self._eval_seconds is None else 0.5 * (self._eval_seconds + t_eval)
+        y_full = None
+        if not adaptive:
+            fig.eval_context.store(self._func, self._var, x_values, y_values)
+            y_full = fig.eval_context.lookup(self._func, self._var, x_values)
+
+        # 4. Decimate to the pixel resolution of the viewport: the trace data is
+        #    serialized to the browser on every frame, extra points cannot be drawn.
+        x_values, y_values = decimate_minmax(x_values, y_values, float(viewport[0]), float(viewport[1]), pixel_width)
+
+        # 5. Update Trace (arrays travel as binary buffers in the trace dtype)
+        x_send = np.asarray(x_values, dtype=dtype)
+        y_send = np.asarray(y_values, dtype=dtype)
+        if fig.render_cache_bytes > 0:
+            if self._y_buffer is not None and np.shares_memory(y_send, self._y_buffer):
+                y_send = y_send.copy()  # the buffer is overwritten by the next frame
+            entry = (x_send, y_send) if y_full is None else (x_send, y_send, y_full)
+            self._render_cache.put(cache_key, entry, fig.render_cache_bytes)
+        t = self._lap("decimate", t)
+        self._push(x_send, y_send)
+        self._lap("push", t)
+        self._needs_refine = False
+
+    def _lap(self, phase: str, t: float) -> float:
+        """Record the time since ``t`` as ``phase`` and return the current time."""
+        now = time.perf_counter()
+        self._timings[phase] = now - t
+        return now
+
+    def _wants_preview(self) -> bool:
+        """Whether a parameter render should push a coarse preview first."""
+        mode = self._progressive if self._progressive is not None else self._smart_figure.progressive
+        if mode == "auto":
+            # Only plots whose full evaluation does not fit in a frame.
+            budget = self._smart_figure._scheduler.interval or 1 / 30
+            return self._eval_seconds is not None and self._eval_seconds > budget
+        return bool(mode)
+
+    def _covers_viewport(self) -> bool:
+        """True if the trace data spans the current viewport at (about) its zoom level."""
+        if self._rendered_window is None:
+            return False
+        fig = self._smart_figure
+        viewport = fig.current_x_range or fig.x_range
+        x_min, x_max, rendered_span = self._rendered_window
+        view_span = float(viewport[1]) - float(viewport[0])
+        if not (view_span > 0 and rendered_span > 0):
+            return False
+        low, high = self._ZOOM_TOLERANCE
+        return (
+            x_min <= float(viewport[0]) and float(viewport[1]) <= x_max
+            and low <= rendered_span / view_span <= high
+        )
+
+    def _push(self, x_send: np.ndarray, y_send: np.ndarray) -> None:
+        """Assign trace data; x is only reassigned (validated, copied and diffed by
+        Plotly) when the grid actually changed."""
+        with self._smart_figure.figure_widget.batch_update():
+            if self._sent_x is None or self._sent_x.dtype != x_send.dtype or not np.array_equal(self._sent_x, x_send):
+                self._plot_handle.x = x_send
+                self._sent_x = x_send
+            self._plot_handle.y = y_send
     
+    def _render_linear(self, x_values: np.ndarray, param_values: Sequence[float], grid_key: Tuple[float, float, int]) -> np.ndarray:
+        """Evaluate ``offset + params @ basis`` into the y-buffer, building the basis if needed."""
+        if self._basis is None or self._basis_key != grid_key:
+            # Row 0: all parameters zero (the offset); row i: unit vector e_i.
+            n = len(self._parameters)
+            candidates = np.vstack([np.zeros(n), np.eye(n)])
+            rows = self._f_numpy.sweep(x_values, *candidates.T, swept=list(range(1, n + 1)))
+            offset = rows[0].copy()
+            self._basis = (offset, rows[1:] - offset)
+            self._basis_key = grid_key
+        offset, basis = self._basis
+        np.matmul(np.asarray(param_values, dtype=float), basis, out=self._y_buffer)
+        np.add(self._y_buffer, offset, out=self._y_buffer)
+        return self._y_buffer
+
     def update(self, **kwargs: Any) -> None:
         """Convenience to update multiple attributes (function, label, domain) at once."""
         if 'label' in kwargs: 
@@ -819,6 +1247,12 @@ class SmartPlot:
                 self.sampling_points = None
             else:
                 self.sampling_points = InputConvert(val, int)
+
+        if kwargs.get('adaptive_sampling') is not None:
+            self.adaptive_sampling = kwargs['adaptive_sampling']
+
+        if kwargs.get('progressive') is not None:
+            self.progressive = kwargs['progressive']
         
         # Function update
         if any(k in kwargs for k in ('var', 'func', 'parameters')):
@@ -829,6 +1263,413 @@ class SmartPlot:
             self.render()
 
 
+# =============================================================================
+# SECTION: RenderStats (Timing instrumentation) [id: RenderStats]
+# =============================================================================
+
+class RenderStats:
+    """
+    Rolling timing statistics of a figure's renders (``SmartFigure.perf``).
+
+    Every render records durations under string keys:
+
+    - ``"render:<reason>"``: the whole :meth:`SmartFigure.render` call,
+    - ``"plot:<id>:<phase>"``: one plot's ``sample``, ``eval``, ``decimate`` and
+      ``push`` phases,
+    - ``"info:<id>"`` and ``"hook:<id>"``: info components and other parameter hooks.
+
+    Only the last ``window`` samples per key are kept, so the percentiles describe the
+    current interaction (e.g. an ongoing slider drag) rather than the whole session.
+    Statistics are reported in milliseconds.
+
+    Examples
+    --------
+    >>> fig.perf.summary()["render:param_change"]["p90"]  # doctest: +SKIP
+    >>> print(fig.perf)  # table, slowest p90 first  # doctest: +SKIP
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = int(window)
+        self.enabled = True
+        self._samples: Dict[str, deque] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add one duration (seconds) for ``key``."""
+        if not self.enabled:
+            return
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def keys(self) -> list:
+        return list(self._samples)
+
+    def percentile(self, key: str, q: float) -> float:
+        """``q``-th percentile (0-100) of the durations of ``key``, in ms (NaN if none)."""
+        samples = self._samples.get(key)
+        if not samples:
+            return float("nan")
+        return 1e3 * float(np.percentile(np.fromiter(samples, float, len(samples)), q))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per key: ``count``, ``mean``, ``p50``, ``p90``, ``p99`` and ``max`` (ms)."""
+        result = {}
+        for key, samples in self._samples.items():
+            ms = 1e3 * np.fromiter(samples, float, len(samples))
+            p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+            result[key] = {
+                "count": len(ms), "mean": float(ms.mean()),
+                "p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(ms.max()),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._samples.clear()
+
+    def report(self, top: Optional[int] = None) -> str:
+        """Plain-text table of the keys, sorted by p90 (slowest first)."""
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]["p90"])[:top]
+        if not rows:
+            return "no renders recorded"
+        width = max(len(key) for key, _ in rows)
+        lines = [f"{'':<{width}}  {'n':>5}  {'p50':>8}  {'p90':>8}  {'max':>8}  (ms)"]
+        for key, st in rows:
+            lines.append(f"{key:<{width}}  {st['count']:>5}  {st['p50']:>8.2f}  {st['p90']:>8.2f}  {st['max']:>8.2f}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return self.report()
+
+
+class _PerfHUD:
+    """Info-panel table of the slowest render phases (see ``SmartFigure.show_perf_hud``)."""
+
+    _REFRESH_INTERVAL = 0.5  # seconds; the HUD must not cost a frame itself
+
+    def __init__(self, out: widgets.Output, perf: RenderStats, top: int = 8) -> None:
+        self._perf = perf
+        self.top = top
+        self._last_refresh_t = float("-inf")
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._html = widgets.HTML(value="<code>…</code>")
+        out.clear_output()
+        with out:
+            display(self._html)
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        wait = self._last_refresh_t + self._REFRESH_INTERVAL - now
+        if not force and wait > 0:
+            # Rate-limited: show the final state once the interval has passed.
+            loop = _running_event_loop()
+            if self._handle is None and loop is not None:
+                self._handle = loop.call_later(wait, self._on_timer)
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._last_refresh_t = now
+        self._html.value = f"<pre style='font-size: 0.75em; margin: 0'>{html.escape(self._perf.report(self.top))}</pre>"
+
+    def _on_timer(self) -> None:
+        self._handle = None
+        self.refresh(force=True)
+
+
+# =============================================================================
+# SECTION: EvaluationContext (Shared samples) [id: EvaluationContext]
+# =============================================================================
+
+def _grid_key(x: np.ndarray) -> Tuple[float, float, int]:
+    # Grids in the context are uniform (``linspace``): end points and size identify them.
+    return (float(x[0]), float(x[-1]), len(x))
+
+
+@lru_cache(maxsize=1024)
+def _expr_params(expr: Expr, var: Symbol) -> Tuple[Symbol, ...]:
+    """Free symbols of ``expr`` other than ``var``, in canonical order."""
+    return tuple(sorted(expr.free_symbols - {var}, key=lambda s: s.sort_key()))
+
+
+class _EvalKey(NamedTuple):
+    """An expression prepared for :class:`EvaluationContext` lookups (see :meth:`EvaluationContext.key`)."""
+
+    expr: Expr
+    var: Symbol
+    params: Tuple[Symbol, ...]
+
+
+@lru_cache(maxsize=256)
+def _reduce_known(expr: Expr, var: Symbol, known: frozenset) -> Tuple[Callable, Tuple[Expr, ...], Tuple[Symbol, ...]]:
+    """
+    Compile ``expr`` with the ``known`` subexpressions (already evaluated) as inputs.
+
+    Returns ``(f, used, params)``: ``f(x, *values_of_used, *values_of_params)``. Larger
+    subexpressions are substituted first; ``subs`` also matches partial sums, so
+    ``Abs(F(x) - a*sin(x) - b*sin(2*x))`` reduces to ``Abs(F - M)`` for the known
+    ``F(x)`` and ``M = a*sin(x) + b*sin(2*x)``.
+    """
+    reduced = expr
+    used, placeholders = [], []
+    for k in sorted(known, key=lambda e: -sp.count_ops(e)):
+        placeholder = sp.Symbol(f"_known_{len(used)}")
+        candidate = reduced.subs(k, placeholder)
+        if candidate != reduced:
+            reduced = candidate
+            used.append(k)
+            placeholders.append(placeholder)
+    params = tuple(sorted(reduced.free_symbols - {var, *placeholders}, key=lambda s: s.sort_key()))
+    f = numpify_cached(reduced, args=[var, *placeholders, *params])
+    return f, tuple(used), params
+
+
+class EvaluationContext:
+    """
+    Memo of evaluated curves: ``(expression, grid, parameter values) -> y``.
+
+    Every full-resolution plot evaluation is stored here (see ``SmartFigure.eval_context``).
+    Info components query it instead of evaluating their expressions from scratch:
+    :meth:`evaluate` returns stored samples directly and otherwise compiles the
+    expression with the stored *subexpressions* as inputs. For example, the distance
+    ``Abs(F(x) - model)`` between two plotted curves costs one subtraction on the
+    plot grid instead of re-running the transcendental functions of ``model``.
+
+    Entries are keyed by the values of the parameters they depend on, so plots that
+    were not re-rendered (their parameters did not change) stay valid. Memory is
+    bounded by ``max_bytes`` (least recently used entries are dropped).
+
+    Grids are uniform (``numpy.linspace``) arrays; :meth:`grid` returns a stored one.
+    Returned arrays are shared and must not be modified.
+
+    Components that query the same expression on every slider tick should prepare it
+    once with :meth:`key` and pass the key (and the parameter ``values`` they read
+    anyway) instead of the expression; the lookup then neither inspects the expression
+    nor reads the sliders again.
+
+    Examples
+    --------
+    >>> ctx = fig.eval_context  # doctest: +SKIP
+    >>> xs = ctx.grid(x, window=(-0.5, 0.5), min_points=400)  # doctest: +SKIP
+    >>> ys = ctx.evaluate(sp.Abs(F(x) - model), x, xs)  # doctest: +SKIP
+    >>> xs, ys = ctx.evaluate_on_window(sp.Abs(F(x) - model), x, (-0.5, 0.5), xs)  # doctest: +SKIP
+    >>> k = ctx.key(sp.Abs(F(x) - model), x)  # doctest: +SKIP
+    >>> ys = ctx.evaluate(k, x, xs, values={a: 0.5, b: 1.0})  # doctest: +SKIP
+    """
+
+    def __init__(self, fig: "SmartFigure", max_bytes: int = 4 * 2**20) -> None:
+        self._fig = fig
+        self.max_bytes = int(max_bytes)
+        self._cache = _RenderCache()
+
+    def key(self, expr: Expr, var: Symbol) -> _EvalKey:
+        """Prepare ``expr`` for repeated lookups (accepted wherever an expression is)."""
+        return _EvalKey(expr, var, _expr_params(expr, var))
+
+    def _key(self, expr: Union[Expr, _EvalKey], var: Symbol) -> _EvalKey:
+        return expr if isinstance(expr, _EvalKey) else self.key(expr, var)
+
+    def _value(self, p: Symbol, values: Optional[Dict[Symbol, float]]) -> float:
+        if values is not None and p in values:
+            return values[p]
+        return self._fig.params.get_value(p)
+
+    def _state(self, k: _EvalKey, values: Optional[Dict[Symbol, float]] = None) -> Tuple[float, ...]:
+        if values is not None:
+            try:
+                return tuple([values[p] for p in k.params])  # the usual case: all given
+            except KeyError:
+                pass
+        return tuple(self._value(p, values) for p in k.params)
+
+    def store(
+        self, expr: Union[Expr, _EvalKey], var: Symbol, x: np.ndarray, y: np.ndarray,
+        values: Optional[Dict[Symbol, float]] = None,
+    ) -> None:
+        """Remember ``y = expr(x)`` at the parameter values (``y`` is copied); see :meth:`lookup`."""
+        if self.max_bytes <= 0 or len(x) < 2:
+            return
+        k = self._key(expr, var)
+        key = (var, _grid_key(x), k.expr, self._state(k, values))
+        y = np.array(np.broadcast_to(y, x.shape), dtype=float)
+        self._cache.put(key, (x, y), self.max_bytes)
+
+    def lookup(
+        self, expr: Union[Expr, _EvalKey], var: Symbol, x: np.ndarray, values: Optional[Dict[Symbol, float]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Stored ``expr(x)`` at the current parameter values, or None. ``values`` is a
+        ``{symbol: value}`` mapping used instead of the slider values (parameters that
+        are missing from it are read from the sliders); passing the values a caller
+        has already read saves reading them again.
+        """
+        if len(x) < 2:
+            return None  # never stored
+        k = self._key(expr, var)
+        entry = self._cache.get((var, _grid_key(x), k.expr, self._state(k, values)))
+        return None if entry is None else entry[1]
+
+    def grid(self, var: Symbol, window: Optional[Tuple[float, float]] = None, min_points: int = 2) -> Optional[np.ndarray]:
+        """
+        The stored grid of ``var`` with the most points inside ``window`` (default: the
+        densest grid), or None if no stored grid covers ``window`` with at least
+        ``min_points`` points.
+        """
+        best, best_count = None, min_points - 1
+        for key in self._cache.keys():
+            if key[0] != var:
+                continue
+            x0, x1, n = key[1]
+            if window is None:
+                count = n
+            elif x0 <= window[0] and window[1] <= x1 and x1 > x0:
+                count = int((n - 1) * (window[1] - window[0]) / (x1 - x0)) + 1
+            else:
+                continue
+            if count > best_count:
+                best, best_count = key, count
+        return None if best is None else self._cache.get(best)[0]
+
+    def evaluate(
+        self, expr: Union[Expr, _EvalKey], var: Symbol, x: np.ndarray, values: Optional[Dict[Symbol, float]] = None
+    ) -> np.ndarray:
+        """
+        ``expr`` on the grid ``x`` at the current parameter values, reusing stored
+        samples of ``expr`` or of its subexpressions. The result is stored as well.
+        ``values`` is as in :meth:`lookup`.
+
+        >>> x, a = sp.symbols("x a")
+        >>> fig = SmartFigure(render_interval=0)  # doctest: +ELLIPSIS
+        <...>
+        >>> slider = fig.add_param(a, value=1.0)
+        >>> xs = np.linspace(0.0, 1.0, 5)
+        >>> fig.eval_context.evaluate(a * x, x, xs, values={a: 2.0}).tolist()
+        [0.0, 0.5, 1.0, 1.5, 2.0]
+        >>> fig.eval_context.evaluate(a * x + 1, x, xs, values={a: 2.0}).tolist()
+        [1.0, 1.5, 2.0, 2.5, 3.0]
+        >>> fig.eval_context.evaluate(a * x + 1, x, xs).tolist()  # the slider value
+        [1.0, 1.25, 1.5, 1.75, 2.0]
+        """
+        x = np.asarray(x, dtype=float)
+        k = self._key(expr, var)
+        y = self.lookup(k, var, x, values)
+        if y is not None:
+            return y
+        grid_key = _grid_key(x) if len(x) >= 2 else None
+        known = frozenset(
+            key[2] for key in self._cache.keys()
+            if key[0] == var and key[1] == grid_key and key[3] == self._state(self.key(key[2], var), values)
+        )
+        f, used, params = _reduce_known(k.expr, var, known)
+        known_values = [self.lookup(e, var, x, values) for e in used]
+        y = f(x, *known_values, *(self._value(p, values) for p in params))
+        self.store(k, var, x, y, values)
+        # The store is skipped for tiny grids and for entries larger than ``max_bytes``.
+        stored = self.lookup(k, var, x, values)
+        return stored if stored is not None else np.broadcast_to(y, x.shape)
+
+    def evaluate_on_window(
+        self, expr: Union[Expr, _EvalKey], var: Symbol, window: Tuple[float, float], x: np.ndarray,
+        min_points: int = 2, values: Optional[Dict[Symbol, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ``(xs, ys)`` with ``ys = expr(xs)`` for the samples ``xs`` inside ``window``.
+
+        Uses the stored grid with the most points in ``window`` (see :meth:`grid`) if it
+        has at least ``min_points`` there: plotted curves on it are already evaluated,
+        so only the rest of ``expr`` is computed. Otherwise the grid ``x`` is used.
+        ``values`` is as in :meth:`lookup`.
+        """
+        grid = self.grid(var, window=window, min_points=min_points)
+        xs = np.asarray(x, dtype=float) if grid is None else grid
+        ys = self.evaluate(expr, var, xs, values)
+        inside = (xs >= window[0]) & (xs <= window[1])
+        return xs[inside], ys[inside]
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# =============================================================================
+# SECTION: RenderScheduler (Frame-rate limiting) [id: RenderScheduler]
+# =============================================================================
+
+def _running_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running asyncio loop (the Jupyter kernel's), or None in plain scripts."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    # Pyodide's web loop runs widget callbacks outside a task but is "running".
+    try:
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        return None
+    return loop if loop.is_running() else None
+
+
+class RenderScheduler:
+    """
+    Coalesces render requests and renders at most once per frame interval.
+
+    Slider events can arrive much faster than a figure can be drawn. Instead of
+    rendering once per event (and queueing stale frames), requests only mark the
+    figure as dirty; a timer on the event loop then renders *once* with the current
+    parameter values. A request that arrives while a render is pending is merged into
+    it, and a request right after a render schedules the next one at the end of the
+    interval, so the final value of a drag is always drawn (trailing render).
+
+    Without a running event loop (plain scripts, tests) requests render synchronously.
+    """
+
+    def __init__(self, render: Callable[[str, Any], None], interval: float = 1 / 30) -> None:
+        self._render = render
+        self.interval = float(interval)
+        self._pending: Dict[str, Any] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last_render_t = float("-inf")
+
+    @property
+    def pending(self) -> bool:
+        """True while a coalesced render is waiting for its frame."""
+        return bool(self._pending)
+
+    def request(self, reason: str, trigger: Any = None) -> None:
+        """Ask for a render; ``trigger`` is passed on (only the latest one per reason is kept)."""
+        self._pending.pop(reason, None)
+        self._pending[reason] = trigger
+        if self._handle is not None:
+            return  # already scheduled; it will read the latest values
+        loop = _running_event_loop()
+        if loop is None or self.interval <= 0:
+            self.flush()
+            return
+        delay = max(0.0, self._last_render_t + self.interval - time.monotonic())
+        self._handle = loop.call_later(delay, self._on_timer)
+
+    def flush(self) -> None:
+        """Run the pending render now (no-op if nothing is pending)."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._last_render_t = time.monotonic()
+        # A parameter render also re-draws plots that no longer cover the viewport,
+        # so it subsumes the others.
+        reason = "param_change" if "param_change" in pending else next(reversed(pending))
+        self._render(reason, pending[reason])
+
+    def _on_timer(self) -> None:
+        self._handle = None
+        try:
+            self.flush()
+        except Exception as e:
+            warnings.warn(f"Scheduled render failed: {e}")
+
+
 # =============================================================================
 # SECTION: SmartFigure (The Coordinator) [id: SmartFigure]
 # =============================================================================
@@ -852,8 +1693,12 @@ class SmartFigure:
     - Uses a right-side controls panel for parameter sliders.
     - Supports plotting multiple curves identified by an ``id``.
     - Re-renders curves on:
-      - slider changes,
-      - pan/zoom changes (throttled to at most once every 0.5 seconds).
+      - slider changes (coalesced to at most one render per ``render_interval``,
+        always including the final value; see :class:`RenderScheduler`),
+      - pan/zoom changes that leave the rendered (overscanned) window or change the
+        zoom level, through the same scheduler, so the final view is always drawn.
+    - Progressive rendering of slow plots during slider drags (coarse preview first,
+      full resolution once the sliders settle; see :attr:`progressive`).
 
     Examples
     --------
@@ -866,27 +1711,54 @@ class SmartFigure:
     
     __slots__ = [
         "_layout", "_params", "_info", "_figure", "plots",
-        "_x_range", "_y_range", "_sampling_points", "_debug",
-        "_last_relayout", "_render_info_last_log_t", "_render_debug_last_log_t"
+        "_x_range", "_y_range", "_sampling_points", "_adaptive_sampling", "_transport", "_render_cache_bytes", "_debug",
+        "_overscan", "_render_info_last_log_t", "_render_debug_last_log_t", "_scheduler",
+        "_param_index", "_dirty_params", "_progressive", "_refine_handle", "_perf", "_perf_hud",
+        "_eval_context", "_deferred",
     ]
 
+    # Delay (seconds without parameter changes) before previews are refined.
+    _REFINE_DELAY = 0.15
+
     def __init__(
         self,
         sampling_points: int = 500,
         x_range: RangeLike = (-4, 4),
         y_range: RangeLike = (-3, 3),
         debug: bool = False,
+        adaptive_sampling: bool = False,
+        transport: str = "float64",
+        render_interval: float = 1 / 30,
+        render_cache_bytes: int = 8 * 2**20,
+        overscan: float = 0.25,
+        progressive: Union[bool, str] = "auto",
     ) -> None:
         self._debug = debug
+        self._overscan = self._check_overscan(overscan)
+        self._progressive = self._check_progressive(progressive)
+        self._refine_handle: Optional[asyncio.TimerHandle] = None
+        self._perf = RenderStats()
+        self._perf_hud: Optional[_PerfHUD] = None
+        self._eval_context = EvaluationContext(self)
+        self._deferred = _DeferredRunner(self._perf.record)
         self._sampling_points = sampling_points
+        self._adaptive_sampling = bool(adaptive_sampling)
+        self._transport = self._check_transport(transport)
+        self._render_cache_bytes = int(render_cache_bytes)
         self.plots: Dict[str, SmartPlot] = {}
 
         # 1. Initialize Layout (View)
         self._layout = SmartFigureLayout()
         
         # 2. Initialize Managers
-        # Note: we pass a callback for rendering so params can trigger updates
-        self._params = ParameterManager(self.render, self._layout.params_box)
+        # Note: we pass a callback for rendering so params can trigger updates.
+        # Slider events go through the scheduler, which coalesces them per frame.
+        self._scheduler = RenderScheduler(self.render, render_interval)
+        self._params = ParameterManager(self._on_param_change, self._layout.params_box)
+        # Dependency tracking: symbol -> ids of the plots using it (rebuilt lazily),
+        # and the symbols changed since the last parameter render.
+        self._param_index: Optional[Dict[Symbol, list]] = None
+        self._dirty_params: Dict[Symbol, Any] = {}  # symbol -> latest change event
         self._info = InfoPanelManager(self._layout.info_box)
 
         # 3. Initialize Plotly Figure
@@ -903,10 +1775,9 @@ class SmartFigure:
         self.y_range = y_range
         
         # 5. Bind Events
-        self._last_relayout = time.monotonic()
         self._render_info_last_log_t = 0.0
         self._render_debug_last_log_t = 0.0
-        self._figure.layout.on_change(self._throttled_relayout, "xaxis.range", "yaxis.range")
+        self._figure.layout.on_change(self._on_relayout, "xaxis.range", "yaxis.range")
 
     # --- Properties ---
 
@@ -932,6 +1803,16 @@ class SmartFigure:
         """
         return self._params
     
+    @property
+    def eval_context(self) -> EvaluationContext:
+        """Curves evaluated by the plots, for reuse by info components and hooks."""
+        return self._eval_context
+
+    @property
+    def perf(self) -> RenderStats:
+        """Rolling render timings (per plot phase, hook and info component)."""
+        return self._perf
+
     @property
     def info_output(self) -> Dict[Hashable, widgets.Output]:
         """Dictionary of Info Output widgets indexed by id."""
@@ -976,6 +1857,87 @@ class SmartFigure:
     def sampling_points(self, val: Union[int, str, None]) -> None:
         self._sampling_points = int(InputConvert(val, int)) if isinstance(val, (int, float, str)) and val != "figure_default" else None
 
+    @property
+    def adaptive_sampling(self) -> bool:
+        """
+        Default sampling strategy of the plots.
+
+        If True, ``sampling_points`` is a point *budget*: plots start from a coarse
+        uniform grid and refine where the curve bends or jumps (see ``adaptive_sample``).
+        """
+        return self._adaptive_sampling
+
+    @adaptive_sampling.setter
+    def adaptive_sampling(self, value: bool) -> None:
+        self._adaptive_sampling = bool(value)
+        self.render()
+
+    @property
+    def transport(self) -> str:
+        """
+        Element type of the trace data sent to the browser: ``"float64"`` (default) or
+        ``"float32"``.
+
+        Plotly ships NumPy arrays as binary typed arrays; ``"float32"`` halves the bytes
+        per update (about 7 significant digits, far below screen resolution).
+        """
+        return self._transport
+
+    @transport.setter
+    def transport(self, value: str) -> None:
+        self._transport = self._check_transport(value)
+        self.render()
+
+    @property
+    def render_cache_bytes(self) -> int:
+        """
+        Memory limit (bytes, per plot) for remembered render results; 0 disables the
+        cache. Each plot keeps the most recently used states within this budget.
+        """
+        return self._render_cache_bytes
+
+    @render_cache_bytes.setter
+    def render_cache_bytes(self, value: int) -> None:
+        self._render_cache_bytes = max(0, int(value))
+        for plot in self.plots.values():
+            plot._render_cache.shrink(self._render_cache_bytes)
+
+    @property
+    def overscan(self) -> float:
+        """
+        Extra x-range sampled on each side of the viewport, as a fraction of its width.
+
+        Pans that stay inside the sampled window reuse the data already in the trace;
+        only leaving it (or zooming) triggers a re-render. ``0`` samples exactly the
+        visible range.
+        """
+        return self._overscan
+
+    @overscan.setter
+    def overscan(self, value: float) -> None:
+        self._overscan = self._check_overscan(value)
+        self.render()
+
+    @property
+    def progressive(self) -> Union[bool, str]:
+        """
+        Default progressive rendering mode of the plots.
+
+        - ``True``: during slider drags, push a coarse preview immediately and the
+          full resolution once no parameter changed for a short moment.
+        - ``False``: always render at full resolution.
+        - ``"auto"`` (default): progressive only for plots whose full evaluation takes
+          longer than one frame (``render_interval``).
+
+        Previews need a running event loop (a notebook kernel) to be refined later;
+        without one every render is at full resolution.
+        """
+        return self._progressive
+
+    @progressive.setter
+    def progressive(self, value: Union[bool, str]) -> None:
+        self._progressive = self._check_progressive(value)
+
     # --- Public API ---
 
     def plot(
@@ -986,6 +1948,8 @@ class SmartFigure:
         id: Optional[str] = None,
         x_domain: Optional[RangeLike] = None,
         sampling_points: Optional[Union[int, str]] = None,
+        adaptive_sampling: Optional[Union[bool, str]] = None,
+        progressive: Optional[Union[bool, str]] = None,
     ) -> SmartPlot:
         """
         Plot a SymPy expression on the figure (and keep it “live”).
@@ -1005,6 +1969,12 @@ class SmartFigure:
             If None, it is the same as "figure_default" for new plots while no change for existing plots.
         id : str, optional
             Unique identifier. If exists, the existing plot is updated in-place.
+        adaptive_sampling : bool or None, optional
+            Refine samples where the curve bends or jumps, with ``sampling_points`` as
+            the budget. If None or "figure_default", the figure's setting is used.
+        progressive : bool, "auto" or None, optional
+            Coarse-then-fine rendering during slider drags (see :attr:`progressive`).
+            If None or "figure_default", the figure's setting is used.
         """
         # ID Generation
         if id is None:
@@ -1032,14 +2002,19 @@ class SmartFigure:
             update_dont_create = False
 
         if update_dont_create:
-            self.plots[id].update(var=var, func=func, parameters=parameters, x_domain=x_domain, sampling_points=sampling_points)
+            self.plots[id].update(
+                var=var, func=func, parameters=parameters, x_domain=x_domain, sampling_points=sampling_points,
+                adaptive_sampling=adaptive_sampling, progressive=progressive,
+            )
             plot = self.plots[id]    
         else: 
             plot = SmartPlot(
                 var=var, func=func, smart_figure=self, parameters=parameters,
-                x_domain=x_domain, sampling_points=sampling_points, label=id
+                x_domain=x_domain, sampling_points=sampling_points, label=id,
+                adaptive_sampling=adaptive_sampling, progressive=progressive,
             )
             self.plots[id] = plot
+            self._param_index = None
         
         return plot
         
@@ -1048,24 +2023,66 @@ class SmartFigure:
         """
         Render all plots on the figure.
 
-        This is a *hot* method: it is called during slider drags and (throttled)
-        pan/zoom relayout events.
+        This is a *hot* method: it is called during slider drags and pan/zoom
+        relayout events (both coalesced by the :class:`RenderScheduler`).
+
+        For slider-driven renders (``reason="param_change"``) only the plots whose
+        parameters changed are re-evaluated, and hooks registered with ``params`` only
+        run if one of their parameters changed. Relayout renders only re-evaluate plots
+        whose rendered window no longer covers the viewport.
+
+        Progressive plots are drawn as coarse previews by parameter renders; a
+        ``reason="refine"`` render (scheduled once the parameters settle) redraws them
+        at full resolution.
         """
         self._log_render(reason, trigger)
+        t_render = time.perf_counter()
+        perf = self._perf
+
+        changed: Dict[Symbol, Any] = {}
+        if reason == "param_change":
+            changed, self._dirty_params = self._dirty_params, {}
         
-        # 1. Update all plots
-        for plot in self.plots.values():
-            plot.render()
+        # 1. Update plots (all of them, or only the dependents of the changed parameters
+        #    and the plots the viewport has moved away from)
+        if changed or reason == "relayout":
+            plots = self._dependent_plots(set(changed)) if changed else []
+            plots += [p for p in self.plots.values() if p not in plots and not p._covers_viewport()]
+        elif reason == "refine":
+            plots = [p for p in self.plots.values() if p._needs_refine or not p._covers_viewport()]
+        else:
+            plots = list(self.plots.values())
+        preview_ok = reason == "param_change" and _running_event_loop() is not None
+        plot_ids = {plot: plot_id for plot_id, plot in self.plots.items()} if perf.enabled else {}
+        for plot in plots:
+            plot.render(preview=preview_ok and plot._wants_preview())
+            for phase, seconds in plot._timings.items():
+                perf.record(f"plot:{plot_ids.get(plot)}:{phase}", seconds)
+        if any(p._needs_refine for p in self.plots.values()):
+            self._schedule_refine()
         
         # 2. Run hooks (if triggered by parameter change)
         # Note: ParameterManager triggers this render, then we run hooks.
         if reason == "param_change" and trigger:
              hooks = self._params.get_hooks()
              for h_id, callback in list(hooks.items()):
+                 hook_params = self._params.get_hook_params(h_id)
+                 hook_trigger = trigger
+                 if changed and hook_params is not None:
+                     relevant = [c for s, c in changed.items() if s in hook_params]
+                     if not relevant:
+                         continue
+                     hook_trigger = relevant[-1]
+                 t_hook = time.perf_counter()
                  try:
-                     callback(trigger, self) # Pass self (SmartFigure) to hooks
+                     callback(hook_trigger, self) # Pass self (SmartFigure) to hooks
                  except Exception as e:
                      warnings.warn(f"Hook {h_id} failed: {e}")
+                 perf.record(self._hook_perf_key(h_id), time.perf_counter() - t_hook)
+
+        perf.record(f"render:{reason}", time.perf_counter() - t_render)
+        if self._perf_hud is not None:
+            self._perf_hud.refresh()
 
     def add_param(self, symbol: Symbol, **kwargs: Any) -> SmartFloatSlider:
         """
@@ -1086,6 +2103,17 @@ class SmartFigure:
     # Alias for backward compatibility
     new_info_output = get_info_output
 
+    def show_perf_hud(self, id: Hashable = "perf", top: int = 8, **kwargs: Any) -> widgets.Output:
+        """
+        Show a small table of the slowest render phases (``fig.perf``) in the Info panel.
+
+        The table is refreshed after renders, at most twice per second.
+        """
+        out = self.get_info_output(id, **kwargs)
+        self._perf_hud = _PerfHUD(out, self._perf, top)
+        self._perf_hud.refresh(force=True)
+        return out
+
     def add_info_component(self, id: Hashable, component_factory: Callable, hook_id: Optional[Hashable] = None, **kwargs: Any) -> Any:
         """
         Register (or replace) a stateful *info component*.
@@ -1093,37 +2121,142 @@ class SmartFigure:
         An info component is a class/function that:
         1. Draws into an Info Output widget.
         2. Implements an `update(change, fig, out)` method.
+
+        If the component has a ``params`` attribute (symbols it reads), it is only
+        updated when one of those parameters changes.
+
+        Slow components can run *deferred*, i.e. on the event loop after the plots
+        have been pushed, so they do not delay slider feedback. A component is
+        deferred if it
+
+        - sets ``deferred = True`` (``update`` is called soon after the render), or
+        - defines ``update`` as ``async def`` (it runs as an asyncio task), or
+        - implements ``compute(values)`` and ``display(result, fig, out)`` (both; they
+          take precedence over ``update``): ``compute`` gets a ``{symbol: value}``
+          snapshot and runs in a worker thread where threads are available;
+          ``display`` runs on the event loop.
+
+        ``compute`` may call ``numpify``/``numpify_cached`` functions (their caches are
+        locked and scratch buffers are per thread), but must not touch widgets or the
+        figure (including :attr:`eval_context`); collect such inputs in ``display``
+        or ``update`` instead.
+
+        A new parameter change cancels the component's pending run, and a computed
+        result is only displayed if it belongs to the latest parameter state.
+        Without a running event loop (plain scripts), deferred components run
+        immediately.
+
+        Components that need values of plotted curves (or of expressions built from
+        them) should get them from :attr:`eval_context` rather than evaluating again.
         """
         out = self.get_info_output(id, **kwargs)
         inst = component_factory(out, self)
         
-        if not hasattr(inst, 'update'):
-            raise TypeError(f"Component {id} must have an 'update' method")
+        if not hasattr(inst, 'update') and not _computes(inst):
+            raise TypeError(f"Component {id} must have an 'update' method (or 'compute' and 'display')")
         
         self._info.add_component(id, inst)
         
         # Register hook to update component on param change
         if hook_id is None: hook_id = ("info_component", id)
         
-        def _hook(change: Dict, fig: SmartFigure) -> None:
-            inst.update(change, fig, out)
+        if _is_deferred(inst):
+            key = self._hook_perf_key(hook_id)
+
+            def _hook(change: Dict, fig: SmartFigure) -> None:
+                fig._deferred.submit(key, inst, change, fig, out)
+        else:
+            def _hook(change: Dict, fig: SmartFigure) -> None:
+                inst.update(change, fig, out)
             
-        self.add_param_change_hook(_hook, hook_id=hook_id)
+        params = getattr(inst, "params", None)
+        self.add_param_change_hook(_hook, hook_id=hook_id, params=None if params is None else list(params))
         return inst
 
-    def add_param_change_hook(self, callback: Callable[[Dict, SmartFigure], Any], hook_id: Optional[Hashable] = None) -> Hashable:
+    def add_param_change_hook(
+        self, callback: Callable[[Dict, SmartFigure], Any], hook_id: Optional[Hashable] = None,
+        params: Optional[Sequence[Symbol]] = None,
+    ) -> Hashable:
         """
-        Register a callback to run when *any* parameter value changes.
+        Register a callback to run when *any* parameter value changes
+        (or, if ``params`` is given, when one of these parameters changes).
+
+        Changes are coalesced per frame (see :class:`RenderScheduler`): the callback
+        runs once and gets the latest change event (of its ``params``, if given); it
+        should read the current values from the figure rather than from the event.
         """
-        return self._params.add_hook(callback, hook_id, fig=self)
+        return self._params.add_hook(callback, hook_id, fig=self, params=params)
 
     # --- Internal / Plumbing ---
 
-    def _throttled_relayout(self, *args: Any) -> None:
-        now = time.monotonic()
-        if now - self._last_relayout > 0.5:
-            self._last_relayout = now
-            self.render(reason="relayout")
+    def _on_param_change(self, reason: str, change: Any) -> None:
+        symbol = self._params.symbol_for(change.get("owner")) if isinstance(change, dict) else None
+        if symbol is None:
+            # Unknown source: treat as "everything changed".
+            self._dirty_params.update(dict.fromkeys(self._params.keys(), change))
+        else:
+            self._dirty_params.pop(symbol, None)
+            self._dirty_params[symbol] = change
+        self._scheduler.request(reason, change)
+
+    def _dependent_plots(self, symbols: set) -> list:
+        """Plots whose parameters intersect ``symbols`` (via the lazily rebuilt index)."""
+        if self._param_index is None:
+            index: Dict[Symbol, list] = {}
+            for plot_id, plot in self.plots.items():
+                for p in plot._parameters:
+                    index.setdefault(p, []).append(plot_id)
+            self._param_index = index
+        ids = {plot_id for s in symbols for plot_id in self._param_index.get(s, ())}
+        return [plot for plot_id, plot in self.plots.items() if plot_id in ids]
+
+    @staticmethod
+    def _check_transport(value: str) -> str:
+        if value not in ("float64", "float32"):
+            raise ValueError(f"transport must be 'float64' or 'float32', got {value!r}")
+        return value
+
+    @staticmethod
+    def _check_overscan(value: float) -> float:
+        value = float(InputConvert(value, float))
+        if not value >= 0:
+            raise ValueError(f"overscan must be >= 0, got {value!r}")
+        return value
+
+    @staticmethod
+    def _check_progressive(value: Union[bool, str]) -> Union[bool, str]:
+        if value == "auto":
+            return "auto"
+        if isinstance(value, (bool, np.bool_)):
+            return bool(value)
+        raise ValueError(f"progressive must be True, False or 'auto', got {value!r}")
+
+    def _schedule_refine(self) -> None:
+        """(Re)start the settle timer after which previews are rendered in full."""
+        if self._refine_handle is not None:
+            self._refine_handle.cancel()
+            self._refine_handle = None
+        loop = _running_event_loop()
+        if loop is None:
+            self.render(reason="refine")
+            return
+        self._refine_handle = loop.call_later(self._REFINE_DELAY, self._on_refine_timer)
+
+    def _on_refine_timer(self) -> None:
+        self._refine_handle = None
+        self._scheduler.request("refine")
+
+    @staticmethod
+    def _hook_perf_key(hook_id: Hashable) -> str:
+        if isinstance(hook_id, tuple) and len(hook_id) == 2 and hook_id[0] == "info_component":
+            return f"info:{hook_id[1]}"
+        key = str(hook_id)
+        return key if key.startswith("hook:") else f"hook:{key}"  # generated ids have it already
+
+    def _on_relayout(self, *args: Any) -> None:
+        # Coalesced like slider events: a fast pan renders once per frame and always
+        # once more for its final view.
+        self._scheduler.request("relayout")
 
     def _log_render(self, reason: str, trigger: Any) -> None:
         # Simple rate-limited logging implementation
@@ -1,6 +1,6 @@
 from .prelude import *
 from .NamedFunction import NamedFunction as NamedFunction
-from .numpify import numpify as numpify, numpify_cached 
+from .numpify import numpify as numpify, numpify_cached, enable_numpify_disk_cache, disable_numpify_disk_cache, linear_decomposition, NumpifyHandle
 from .SmartFigure import SmartFigure as Figure
 # from .SmartException import *
 # from .SmartFigure import *
@@ -22,11 +22,15 @@ Dependencies
 ------------
 - NumPy (required)
 - SymPy (required)
+- numba, numexpr (optional; only for ``backend="numba"`` / ``backend="numexpr"``)
 
 Public API
 ----------
 - :func:`numpify`
 - :func:`numpify_cached`
+- :func:`enable_numpify_disk_cache` / :func:`disable_numpify_disk_cache`
+- :func:`linear_decomposition`
+- :class:`NumpifyHandle`
 
 How custom functions are handled
 --------------------------------
@@ -67,6 +71,27 @@ Symbol binding (treat `a` as an injected constant):
 >>> g(np.array([1, 2, 3]))
 array([2., 4., 6.])
 
+Common-subexpression elimination (shared terms are computed once):
+>>> h = numpify(sp.exp(-x**2) + sp.sin(x**2), args=x, cse=True)
+>>> print(h._generated_source)  # doctest: +NORMALIZE_WHITESPACE
+def _generated(x):
+    x = numpy.asarray(x)
+    _cse0 = x**2
+    return numpy.sin(_cse0) + numpy.exp(-_cse0)
+
+Parameter sweeps evaluate many candidate argument values in memory-bounded chunks:
+>>> a = sp.Symbol("a")
+>>> p = numpify(a * x, args=(x, a))
+>>> p.sweep(np.array([1.0, 2.0]), np.array([1.0, 10.0, 100.0]), swept="a")
+array([[  1.,   2.],
+       [ 10.,  20.],
+       [100., 200.]])
+
+Trigonometric sums become a cached basis matrix times a coefficient vector:
+>>> s = numpify(sp.sin(2 * sp.pi * x) - sp.cos(4 * sp.pi * x) / 2, args=x, fourier=True)
+>>> s._generated_expr_code
+'_fourier(x, (-1/2, 1,))'
+
 Logging
 -------
 This module uses Python's standard :mod:`logging` library and is silent by default.
@@ -83,20 +108,39 @@ module name instead.
 
 from __future__ import annotations
 
-from functools import lru_cache
-
+import hashlib
+import importlib
+import inspect
+import json
 import logging
+import math
+import os
 import time
 import textwrap
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union, cast
+import threading
+import types
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 import sympy as sp
 from sympy.core.function import FunctionClass
+from sympy.printing.codeprinter import PrintMethodNotImplementedError
+from sympy.printing.lambdarepr import NumExprPrinter
 from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.pycode import PythonCodePrinter
 
 
-__all__ = ["numpify", "numpify_cached"]
+__all__ = [
+    "numpify",
+    "numpify_cached",
+    "enable_numpify_disk_cache",
+    "disable_numpify_disk_cache",
+    "linear_decomposition",
+    "NumpifyHandle",
+]
 
 
 logger = logging.getLogger(__name__)
@@ -117,6 +161,10 @@ def numpify(
     f_numpy: Optional[Mapping[_BindingKey, Any]] = None,
     vectorize: bool = True,
     expand_definition: bool = True,
+    cse: bool = False,
+    fourier: bool = False,
+    workspace: bool = False,
+    backend: str = "numpy",
 ) -> Callable[..., Any]:
     """Compile a SymPy expression into a NumPy-evaluable Python function.
 
@@ -153,10 +201,57 @@ def numpify(
         If a function is opaque (its rewrite returns itself), the function call remains
         in the expression and must be bound via ``f_numpy`` or ``F.f_numpy``.
 
+        For sums, expansion (like Fourier matching and printing) is done and memoized
+        per term, so recompiling a model that gained one term only processes that term.
+
+    cse:
+        If True, run :func:`sympy.cse` on the (expanded) expression and emit the shared
+        subexpressions as named intermediate assignments (``_cse0 = ...``) before the
+        ``return`` line. Each shared subexpression (e.g. ``pi*x`` in a Fourier sum) is
+        then evaluated once per call instead of once per occurrence.
+
+    fourier:
+        If True, recognize trigonometric sums
+        ``sum_n c_n*sin(k_n*x) + d_n*cos(k_n*x)`` (numeric frequencies ``k_n``,
+        coefficients independent of ``x``) with at least ``_FOURIER_MIN_TERMS`` terms.
+        They are evaluated as one matrix-vector product ``B @ c`` where the basis
+        matrix ``B[i, n] = sin(k_n*x_i)`` (or ``cos``) is cached per sample grid. When
+        only the coefficients change between calls (e.g. slider parameters), no
+        transcendental functions are evaluated at all. Bases of all compiled functions
+        share one LRU cache of at most ``_FOURIER_BASIS_CACHE_BYTES``; complex sample
+        points are evaluated directly, without the cache.
+
+    workspace:
+        If True, the generated function accepts a keyword-only ``out=`` array and
+        evaluates every arithmetic node with ufunc ``out=`` arguments into ``out`` and
+        a few scratch buffers owned by the compiled function (reused across calls of
+        the same shape). Repeated calls with the same ``out`` then allocate nothing for
+        arithmetic/elementary-function nodes. ``out`` must have the broadcast shape of
+        the inputs; results are float64 (real-valued). Requires ``vectorize=True``.
+
+    backend:
+        ``"numpy"`` (default) evaluates the expression node by node with NumPy ufuncs.
+        ``"numba"`` compiles it to a scalar kernel with :func:`numba.vectorize`, so
+        all nodes run in one fused loop over the samples (float64, real-valued; the
+        kernel source is part of ``_generated_source``). ``fourier`` does not apply,
+        ``workspace`` maps to the ufunc's ``out=``. If numba is not installed or the
+        expression cannot be compiled (bound ``f_numpy`` functions, functions outside
+        :mod:`math`, complex values), a :class:`RuntimeWarning` is issued and the
+        NumPy backend is used.
+        ``"numexpr"`` evaluates the expression with one ``numexpr.evaluate`` call
+        (blocked, multithreaded, no full-size temporaries). Subtrees numexpr does not
+        support, such as bound ``f_numpy`` functions, are evaluated with NumPy first
+        and passed in as operands. ``fourier`` does not apply; ``workspace`` maps to
+        ``evaluate(..., out=)``. Falls back to NumPy with a warning if numexpr is not
+        installed.
+
     Returns
     -------
     Callable[..., Any]
-        A generated function. The function includes its generated source in ``__doc__``.
+        A generated function. The function includes its generated source in ``__doc__``
+        and has a ``sweep(*args, swept=..., max_bytes=...)`` method that evaluates many
+        candidate values of selected arguments in memory-bounded chunks and returns
+        them stacked along a new leading axis.
 
     Raises
     ------
@@ -166,6 +261,8 @@ def numpify(
     ValueError
         If ``expr`` contains unbound symbols or unbound unknown functions.
         If symbol bindings overlap with argument symbols.
+        If ``workspace=True`` is combined with ``vectorize=False``.
+        If ``backend`` is unknown.
 
     Notes
     -----
@@ -183,16 +280,23 @@ def numpify(
 
     # 2) Normalize args.
     args_tuple = _normalize_args(expr, args)
+    if workspace and not vectorize:
+        raise ValueError("numpify(workspace=True) requires vectorize=True")
+    if backend not in _BACKENDS:
+        raise ValueError(f"numpify: unknown backend {backend!r} (expected one of {', '.join(_BACKENDS)})")
 
+    # Timings are cheap to take and are kept on the result (``_numpify_timings``) for
+    # cache statistics; they are only logged at DEBUG level.
     log_debug = logger.isEnabledFor(logging.DEBUG)
-    t_total0: float | None = time.perf_counter() if log_debug else None
+    t_total0 = time.perf_counter()
     if log_debug:
         logger.debug("numpify: detected args=%s", [a.name for a in args_tuple])
 
     # 3) Optionally expand custom definitions.
+    t_expand0 = time.perf_counter()
     if expand_definition:
-        expr = _rewrite_expand_definition(expr)
-        expr = sp.expand(expr, deep=True)
+        expr = _expand_termwise(expr)
+    t_expand_s = time.perf_counter() - t_expand0
 
     # 4) Parse bindings.
     sym_bindings, func_bindings = _parse_bindings(expr, f_numpy)
@@ -218,22 +322,106 @@ def numpify(
         )
 
     # 7) Create printer (allow unknown functions to print as plain calls).
-    printer = NumPyPrinter(settings={"user_functions": {}, "allow_unknown_functions": True})
+    printer = NumPyPrinter(settings=_NUMPY_PRINTER_SETTINGS)
 
     # 8) Preflight: any function that prints as a *bare* call must be bound.
     _require_bound_unknown_functions(expr, printer, func_bindings)
 
     # 9) Generate expression code and function source.
+    # Everything needed to rebuild the function is plain data (see _link_generated),
+    # so the persistent cache can store it as JSON.
+    t_codegen0 = time.perf_counter()
+    generated: Optional[Dict[str, Any]] = None
+    try:
+        if backend == "numba":
+            generated = _generate_numba(expr, args_tuple, sym_bindings, func_bindings, cse=cse, workspace=workspace)
+        elif backend == "numexpr":
+            generated = _generate_numexpr(
+                expr, args_tuple, sym_bindings,
+                printer=printer, vectorize=vectorize, cse=cse, workspace=workspace,
+            )
+    except _BackendUnsupported as e:
+        _warn_backend_fallback(backend, str(e))
+    if generated is None:
+        generated = _generate_numpy(
+            expr, args_tuple, sym_bindings, printer, vectorize=vectorize, cse=cse, fourier=fourier, workspace=workspace
+        )
+    generated["expr_repr"] = _repr_termwise(expr)
+    generated["arg_names"] = [a.name for a in args_tuple]
+    generated["func_names"] = sorted({app.func.__name__ for app in expr.atoms(sp.Function)} & func_bindings.keys())
+    t_codegen_s = time.perf_counter() - t_codegen0
+
+    try:
+        fn, t_dict_s, t_exec_s = _link_generated(generated, sym_bindings, func_bindings)
+    except _BackendUnsupported as e:
+        # The kernel could not be compiled (e.g. complex-valued): redo with NumPy.
+        _warn_backend_fallback(generated["backend"], str(e))
+        generated.update(_generate_numpy(
+            expr, args_tuple, sym_bindings, printer, vectorize=vectorize, cse=cse, fourier=fourier, workspace=workspace
+        ))
+        fn, t_dict_s, t_exec_s = _link_generated(generated, sym_bindings, func_bindings)
+
+    timings = {
+        "expand": 1000.0 * t_expand_s,
+        "codegen": 1000.0 * t_codegen_s,
+        "dict": 1000.0 * t_dict_s,
+        "exec": 1000.0 * t_exec_s,
+        "total": 1000.0 * (time.perf_counter() - t_total0),
+    }
+    setattr(fn, "_numpify_timings", timings)
+
+    if log_debug:
+        logger.debug(
+            "numpify timings (ms): expand=%.2f codegen=%.2f dict=%.2f exec=%.2f total=%.2f",
+            timings["expand"],
+            timings["codegen"],
+            timings["dict"],
+            timings["exec"],
+            timings["total"],
+        )
+
+    return fn
+
+
+def _generate_numpy(
+    expr: sp.Basic,
+    args_tuple: Tuple[sp.Symbol, ...],
+    sym_bindings: _SymBindings,
+    printer: NumPyPrinter,
+    *,
+    vectorize: bool,
+    cse: bool,
+    fourier: bool,
+    workspace: bool,
+) -> Dict[str, Any]:
+    """Generate the NumPy source of :func:`numpify` (the default backend)."""
     arg_names = [a.name for a in args_tuple]
 
     # "Lambdification"-like code generation step: SymPy -> NumPy expression string.
-    t_codegen0: float | None = time.perf_counter() if log_debug else None
-    expr_code = printer.doprint(expr)
-    t_codegen_s = (time.perf_counter() - t_codegen0) if t_codegen0 is not None else None
+    # Trigonometric sums are routed through a cached basis matrix (see _TrigBasis).
+    trig_sum = _match_trig_sum(expr, args_tuple) if fourier else None
+    uses_workspace = False
+    if trig_sum is None:
+        targets: list[sp.Basic] = [expr]
+    else:
+        var, freqs, is_sin, coeffs, remainder = trig_sum
+        targets = [*coeffs, remainder]
+    cse_lines, reduced = _cse_split(targets, printer) if cse else ([], targets)
+    codes = [_print_code(printer, e) for e in reduced]
+    if trig_sum is None:
+        (expr_code,) = codes
+    else:
+        *coeff_codes, remainder_code = codes
+        expr_code = f"_fourier({var.name}, ({', '.join(coeff_codes)},))"
+        if remainder != 0:
+            expr_code += f" + ({remainder_code})"
     is_constant = (len(expr.free_symbols) == 0)
 
     lines: list[str] = []
-    lines.append("def _generated(" + ", ".join(arg_names) + "):")
+    if workspace:
+        lines.append("def _generated(" + ", ".join(arg_names) + (", *, out=None):" if arg_names else "*, out=None):"))
+    else:
+        lines.append("def _generated(" + ", ".join(arg_names) + "):")
 
     if vectorize:
         for nm in arg_names:
@@ -243,36 +431,88 @@ def numpify(
     for nm in sorted(sym_bindings.keys()):
         lines.append(f"    {nm} = _sym_bindings[{nm!r}]")
 
-    if vectorize and is_constant and len(arg_names) > 0:
+    lines.extend(cse_lines)
+
+    if workspace:
+        # Result shape: broadcast of everything the final expression reads (all args
+        # for constants, matching the non-workspace broadcasting below).
+        if is_constant:
+            shape_names = arg_names
+        else:
+            shape_names = sorted({s.name for e in reduced for s in e.free_symbols})
+            if trig_sum is not None:
+                shape_names = sorted(set(shape_names) | {var.name})
+        shape_args = ", ".join(f"numpy.shape({nm})" for nm in shape_names)
+        lines.append(f"    _shape = numpy.broadcast_shapes({shape_args})")
+        lines.append("    if out is None:")
+        lines.append("        out = numpy.empty(_shape)")
+        emitter = _InplaceEmitter(printer)
+        if trig_sum is None:
+            emitter.emit(reduced[0], "out")
+        else:
+            emitter.lines.append(f"_fourier({var.name}, ({', '.join(coeff_codes)},), out=out)")
+            if remainder != 0:
+                emitter.accumulate(reduced[-1], "out", "numpy.add")
+        if emitter.n_buffers:
+            lines.append(f"    _w = _workspace.get(_shape, {emitter.n_buffers})")
+            uses_workspace = True
+        lines.extend(f"    {ln}" for ln in emitter.lines)
+        lines.append("    return out")
+    elif vectorize and is_constant and len(arg_names) > 0:
         lines.append(f"    _shape = numpy.broadcast({', '.join(arg_names)}).shape")
         lines.append(f"    return ({expr_code}) + numpy.zeros(_shape)")
     else:
         lines.append(f"    return {expr_code}")
 
-    src = "\n".join(lines)
+    return {
+        "source": "\n".join(lines),
+        "expr_code": expr_code,
+        "backend": "numpy",
+        "fourier": None if trig_sum is None else {"freqs": freqs, "is_sin": is_sin},
+        "workspace": uses_workspace,
+    }
+
 
-    # Runtime globals dict compilation (kept separate for timing / debugging).
-    t_dict0: float | None = time.perf_counter() if log_debug else None
+def _link_generated(
+    generated: Mapping[str, Any], sym_bindings: _SymBindings, func_bindings: _FuncBindings
+) -> Tuple[Callable[..., Any], float, float]:
+    """Execute generated source against its runtime bindings.
+
+    Returns the function plus the globals-dict and ``exec`` timings in seconds.
+    """
+    t_dict0 = time.perf_counter()
     glb: Dict[str, Any] = {
         "numpy": np,
+        "math": math,
         "_sym_bindings": sym_bindings,
         **func_bindings,  # function names like "G" -> callable
     }
-    t_dict_s = (time.perf_counter() - t_dict0) if t_dict0 is not None else None
+    if generated["fourier"] is not None:
+        glb["_fourier"] = _TrigBasis(generated["fourier"]["freqs"], generated["fourier"]["is_sin"])
+    if generated["workspace"]:
+        glb["_workspace"] = _Workspace()
+    t_dict_s = time.perf_counter() - t_dict0
 
     loc: Dict[str, Any] = {}
 
-    t_exec0: float | None = time.perf_counter() if log_debug else None
-    exec(src, glb, loc)
-    t_exec_s = (time.perf_counter() - t_exec0) if t_exec0 is not None else None
+    t_exec0 = time.perf_counter()
+    exec(generated["source"], glb, loc)
+    if generated["backend"] == "numba":
+        glb["_kernel"] = _jit_kernel(loc["_kernel"], generated["kernel_arity"])
+    elif generated["backend"] == "numexpr":
+        import numexpr
+
+        glb["_numexpr"] = numexpr
+    t_exec_s = time.perf_counter() - t_exec0
     fn = cast(Callable[..., Any], loc["_generated"])
 
+    src = generated["source"]
     fn.__doc__ = textwrap.dedent(
         f"""
         Auto-generated NumPy function from SymPy expression.
 
-        expr: {repr(expr)}
-        args: {arg_names}
+        expr: {generated["expr_repr"]}
+        args: {generated["arg_names"]}
 
         Source:
         {src}
@@ -282,19 +522,724 @@ def numpify(
     # Store generated source for inspection in interactive sessions.
     # Use setattr to avoid type-checker complaints on the Callable type.
     setattr(fn, "_generated_source", src)
-    setattr(fn, "_generated_expr_code", expr_code)
+    setattr(fn, "_generated_expr_code", generated["expr_code"])
+    setattr(fn, "_numpify_generated", generated)
+    setattr(fn, "sweep", _make_sweep(fn, generated["arg_names"]))
+    return fn, t_dict_s, t_exec_s
 
-    if log_debug:
-        t_total_s = (time.perf_counter() - t_total0) if t_total0 is not None else None
-        logger.debug(
-            "numpify timings (ms): codegen=%.2f dict=%.2f exec=%.2f total=%.2f",
-            1000.0 * (t_codegen_s or 0.0),
-            1000.0 * (t_dict_s or 0.0),
-            1000.0 * (t_exec_s or 0.0),
-            1000.0 * (t_total_s or 0.0),
+
+def _cse_split(exprs: Sequence[sp.Basic], printer: NumPyPrinter) -> Tuple[list[str], list[sp.Basic]]:
+    """Run :func:`sympy.cse` on ``exprs``.
+
+    Returns the (indented) intermediate assignment lines and the reduced expressions,
+    which refer to the intermediates by name.
+    """
+    # Intermediate names must not shadow arguments or bound symbols.
+    free: set[sp.Basic] = set().union(*(e.free_symbols for e in exprs))
+    names = sp.numbered_symbols("_cse", exclude=free)
+    replacements, reduced = sp.cse(list(exprs), symbols=names)
+    lines = [f"    {sym.name} = {printer.doprint(sub)}" for sym, sub in replacements]
+    return lines, list(reduced)
+
+
+# ---------------------------------------------------------------------------
+# Term-wise compilation of sums
+# ---------------------------------------------------------------------------
+#
+# Models are typically grown one term at a time (``sum_{n<=N} a_n*sin(2*pi*n*x)``).
+# The SymPy work in numpify (definition rewriting, expansion, Fourier matching,
+# printing) is done per term of a top-level Add and memoized per term, so compiling
+# the model with one more term only processes the new term; composing the sum from
+# cached pieces is string/tuple work.
+
+_TERM_CACHE_MAXSIZE = 4096
+_TERMWISE_MIN_TERMS = 4  # smaller sums are printed in one go (SymPy's term order)
+
+# Settings shared by every NumPy printer used in numpify; cached term codes are
+# printed with this one instance.
+_NUMPY_PRINTER_SETTINGS: Dict[str, Any] = {"user_functions": {}, "allow_unknown_functions": True}
+_TERM_PRINTER = NumPyPrinter(settings=_NUMPY_PRINTER_SETTINGS)
+
+
+@lru_cache(maxsize=_TERM_CACHE_MAXSIZE)
+def _expand_term(term: sp.Basic) -> sp.Basic:
+    return sp.expand(_rewrite_expand_definition(term), deep=True)
+
+
+def _expand_termwise(expr: sp.Basic) -> sp.Basic:
+    """``expand(rewrite(expr, "expand_definition"))``, computed term by term for sums."""
+    if isinstance(expr, sp.Add):
+        return sp.Add(*(_expand_term(term) for term in expr.args))
+    return _expand_term(expr)
+
+
+@lru_cache(maxsize=_TERM_CACHE_MAXSIZE)
+def _print_term(term: sp.Basic) -> str:
+    return _TERM_PRINTER.doprint(term)
+
+
+@lru_cache(maxsize=_TERM_CACHE_MAXSIZE)
+def _str_term(term: sp.Basic) -> str:
+    return str(term)
+
+
+def _print_code(printer: NumPyPrinter, expr: sp.Basic) -> str:
+    """Print ``expr`` with ``printer``, composing large sums from cached term codes."""
+    if not isinstance(expr, sp.Add) or len(expr.args) < _TERMWISE_MIN_TERMS:
+        return printer.doprint(expr)
+    return _join_terms([_print_term(term) for term in expr.args])
+
+
+def _repr_termwise(expr: sp.Basic) -> str:
+    """``repr(expr)`` for documentation, composing large sums from cached term strings."""
+    if not isinstance(expr, sp.Add) or len(expr.args) < _TERMWISE_MIN_TERMS:
+        return repr(expr)
+    return _join_terms([_str_term(term) for term in expr.args])
+
+
+def _join_terms(codes: Sequence[str]) -> str:
+    out = codes[0]
+    for code in codes[1:]:
+        out += f" - {code[1:]}" if code.startswith("-") else f" + {code}"
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Trigonometric sums (Fourier fast path)
+# ---------------------------------------------------------------------------
+
+_FOURIER_MIN_TERMS = 2
+_FOURIER_BASIS_CACHE_BYTES = 64 * 2**20  # all cached bases together
+_FOURIER_BASIS_MAX_ELEMENTS = 2**20  # larger bases (samples * modes) are not cached
+
+# Guards the shared caches of this module (compiled functions, relinked copies and
+# trigonometric bases), so compiled functions may be called from worker threads.
+_lock = threading.RLock()
+
+
+class _BasisCache:
+    """LRU cache of trigonometric basis matrices, bounded by their total size in bytes.
+
+    Shared by all compiled functions (and threads, under ``_lock``), so the memory
+    does not grow with the number of cached functions.
+    """
+
+    def __init__(self, maxbytes: int):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...], x: np.ndarray) -> Optional[np.ndarray]:
+        with _lock:
+            hit = self._entries.get(key)
+            if hit is None or not np.array_equal(hit[0], x):
+                return None
+            self._entries.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: tuple[Any, ...], x: np.ndarray, b: np.ndarray) -> None:
+        size = x.nbytes + b.nbytes
+        if size > self.maxbytes:
+            return
+        with _lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[0].nbytes + old[1].nbytes
+            self._entries[key] = (x.copy(), b)
+            self.nbytes += size
+            while self.nbytes > self.maxbytes:
+                _, (ox, ob) = self._entries.popitem(last=False)
+                self.nbytes -= ox.nbytes + ob.nbytes
+
+    def clear(self) -> None:
+        with _lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+_basis_cache = _BasisCache(_FOURIER_BASIS_CACHE_BYTES)
+
+
+class _TrigBasis:
+    """Evaluate ``sum_j c_j * trig_j(k_j * x)`` as a matrix-vector product.
+
+    The basis matrix only depends on the sample grid, so it is computed once per
+    grid and reused (via ``_basis_cache``) while the coefficients change. Scalar
+    coefficients use a single BLAS ``matmul``; array coefficients (broadcasting
+    against ``x``) use ``einsum``.
+    """
+
+    __slots__ = ("freqs", "is_sin", "_key")
+
+    def __init__(self, freqs: Sequence[float], is_sin: Sequence[bool]):
+        self.freqs = np.asarray(freqs, dtype=float)
+        self.is_sin = np.asarray(is_sin, dtype=bool)
+        self._key = (self.freqs.tobytes(), self.is_sin.tobytes())
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        phase = np.multiply.outer(x, self.freqs)
+        return np.where(self.is_sin, np.sin(phase), np.cos(phase))
+
+    def basis(self, x: np.ndarray) -> np.ndarray:
+        """Return the basis matrix of shape ``x.shape + (n_terms,)`` for real ``x``."""
+        if not x.size:
+            return self._evaluate(x)
+        key = (*self._key, x.shape, x.dtype.str, x.flat[0], x.flat[-1])
+        b = _basis_cache.get(key, x)
+        if b is None:
+            b = self._evaluate(x)
+            if b.size <= _FOURIER_BASIS_MAX_ELEMENTS:
+                _basis_cache.put(key, x, b)
+        return b
+
+    def __call__(self, x: Any, coeffs: Sequence[Any], out: Optional[np.ndarray] = None) -> Any:
+        x = np.asarray(x)
+        if np.iscomplexobj(x) or x.dtype == object:
+            b = self._evaluate(x)  # not cached: grids are real in practice
+        else:
+            b = self.basis(x.astype(float, copy=False))
+        c = np.broadcast_arrays(*coeffs)
+        if c[0].ndim == 0 and b.ndim > 1:
+            return np.matmul(b, np.stack(c), out=out)
+        return np.einsum("...m,...m->...", b, np.stack(c, axis=-1), out=out)
+
+
+def _match_trig_sum(
+    expr: sp.Basic, args: Sequence[sp.Symbol]
+) -> Optional[Tuple[sp.Symbol, list[float], list[bool], list[sp.Expr], sp.Expr]]:
+    """Split ``expr`` into a trigonometric sum over one argument plus a remainder.
+
+    Returns ``(var, freqs, is_sin, coeffs, remainder)`` (one entry per basis column in
+    ``freqs``/``is_sin``/``coeffs``) or None when fewer than
+    ``_FOURIER_MIN_TERMS`` terms have the form ``c*sin(k*var)`` / ``c*cos(k*var)``
+    with a real numeric ``k`` and ``c`` independent of ``var``.
+    """
+    if not isinstance(expr, sp.Add):
+        return None
+
+    var: Optional[sp.Symbol] = None
+    columns: dict[tuple[bool, float], sp.Expr] = {}
+    remainder: list[sp.Expr] = []
+    for term in expr.args:
+        match = None
+        for v in ([var] if var is not None else args):
+            term_match = _match_trig_term(term, v)
+            if term_match is not None:
+                match = (v, *term_match)
+                break
+        if match is None:
+            remainder.append(term)
+            continue
+        var, key, coeff = match
+        columns[key] = columns.get(key, sp.S.Zero) + coeff
+
+    if var is None or len(columns) < _FOURIER_MIN_TERMS:
+        return None
+
+    keys = list(columns)
+    return (
+        var,
+        [k for _, k in keys],
+        [is_sin for is_sin, _ in keys],
+        [columns[key] for key in keys],
+        sp.Add(*remainder),
+    )
+
+
+
+@lru_cache(maxsize=_TERM_CACHE_MAXSIZE)
+def _match_trig_term(term: sp.Basic, v: sp.Symbol) -> Optional[Tuple[Tuple[bool, float], sp.Expr]]:
+    """Match ``c*sin(k*v)`` / ``c*cos(k*v)``; returns ``((is_sin, float(k)), c)`` or None."""
+    coeff, trig = term.as_independent(v, as_Add=False)
+    if not isinstance(trig, (sp.sin, sp.cos)):
+        return None
+    k = trig.args[0].as_coefficient(v)
+    if k is None or k.free_symbols or not k.is_real or k.is_zero:
+        return None
+    return (isinstance(trig, sp.sin), float(k)), coeff
+
+# ---------------------------------------------------------------------------
+# In-place evaluation (workspace mode)
+# ---------------------------------------------------------------------------
+
+# Single-argument SymPy functions that map onto NumPy ufuncs supporting ``out=``.
+_INPLACE_UFUNCS: Dict[type, str] = {
+    sp.sin: "numpy.sin",
+    sp.cos: "numpy.cos",
+    sp.tan: "numpy.tan",
+    sp.asin: "numpy.arcsin",
+    sp.acos: "numpy.arccos",
+    sp.atan: "numpy.arctan",
+    sp.sinh: "numpy.sinh",
+    sp.cosh: "numpy.cosh",
+    sp.tanh: "numpy.tanh",
+    sp.asinh: "numpy.arcsinh",
+    sp.acosh: "numpy.arccosh",
+    sp.atanh: "numpy.arctanh",
+    sp.exp: "numpy.exp",
+    sp.log: "numpy.log",
+    sp.Abs: "numpy.absolute",
+    sp.sign: "numpy.sign",
+    sp.floor: "numpy.floor",
+    sp.ceiling: "numpy.ceil",
+}
+
+
+class _Workspace(threading.local):
+    """Scratch buffers of one compiled function, reused while the shape is unchanged.
+
+    Each thread gets its own buffers. Not re-entrant within a thread (a compiled
+    function that calls itself through a bound function would share buffers).
+    """
+
+    def __init__(self) -> None:
+        self._shape: Optional[tuple[int, ...]] = None
+        self._buffers: list[np.ndarray] = []
+
+    def get(self, shape: tuple[int, ...], n: int) -> list[np.ndarray]:
+        if shape != self._shape or len(self._buffers) < n:
+            self._buffers = [np.empty(shape) for _ in range(n)]
+            self._shape = shape
+        return self._buffers
+
+
+class _InplaceEmitter:
+    """Emit ufunc calls that evaluate an expression into preallocated buffers.
+
+    ``Add``/``Mul``/``Pow`` and the functions in ``_INPLACE_UFUNCS`` are computed with
+    ``out=`` into the destination buffer or scratch buffers ``_w[i]`` (allocated by
+    register-style reuse; ``n_buffers`` is the peak count). Everything else (symbols,
+    constants, bound functions, ``Piecewise``, ...) is printed as an ordinary NumPy
+    expression and consumed as an operand.
+    """
+
+    def __init__(self, printer: NumPyPrinter):
+        self.printer = printer
+        self.lines: list[str] = []
+        self.n_buffers = 0
+        self._free: list[str] = []
+
+    def _acquire(self) -> str:
+        if self._free:
+            return self._free.pop()
+        self.n_buffers += 1
+        return f"_w[{self.n_buffers - 1}]"
+
+    def _is_leaf(self, e: sp.Basic) -> bool:
+        if not e.free_symbols or isinstance(e, sp.Symbol):
+            return True
+        if isinstance(e, (sp.Add, sp.Mul, sp.Pow)):
+            return False
+        return type(e) not in _INPLACE_UFUNCS or len(e.args) != 1
+
+    def _operand(self, e: sp.Basic, dest: str) -> str:
+        """Return code for ``e``, computing it into ``dest`` first unless it is a leaf."""
+        if self._is_leaf(e):
+            return self.printer.doprint(e)
+        self.emit(e, dest)
+        return dest
+
+    def emit(self, e: sp.Basic, dest: str) -> None:
+        """Emit lines that store the value of ``e`` into ``dest``."""
+        if self._is_leaf(e):
+            self.lines.append(f"numpy.copyto({dest}, {self.printer.doprint(e)})")
+        elif isinstance(e, (sp.Add, sp.Mul)):
+            self._emit_nary(e, dest)
+        elif isinstance(e, sp.Pow):
+            self._emit_pow(e, dest)
+        else:
+            src = self._operand(e.args[0], dest)
+            self.lines.append(f"{_INPLACE_UFUNCS[type(e)]}({src}, out={dest})")
+
+    def accumulate(self, e: sp.Basic, dest: str, ufunc: str) -> None:
+        """Emit ``dest = ufunc(dest, e)``."""
+        if self._is_leaf(e):
+            self.lines.append(f"{ufunc}({dest}, {self.printer.doprint(e)}, out={dest})")
+            return
+        tmp = self._acquire()
+        self.emit(e, tmp)
+        self.lines.append(f"{ufunc}({dest}, {tmp}, out={dest})")
+        self._free.append(tmp)
+
+    def _emit_nary(self, e: sp.Basic, dest: str) -> None:
+        is_add = isinstance(e, sp.Add)
+        op, inv_op = ("numpy.add", "numpy.subtract") if is_add else ("numpy.multiply", "numpy.divide")
+
+        # Split into direct and inverse operands (x - y, x / y), compound ones first so
+        # the leading operand can be computed in place.
+        direct: list[sp.Basic] = []
+        inverse: list[sp.Basic] = []
+        for a in e.args:
+            if is_add:
+                c, rest = a.as_coeff_Mul()
+                if c == -1 and rest != 1:
+                    inverse.append(rest)
+                    continue
+            elif isinstance(a, sp.Pow) and a.exp == -1:
+                inverse.append(a.base)
+                continue
+            direct.append(a)
+        if not direct:
+            direct.append(sp.S.Zero if is_add else sp.S.One)
+        ops = [(a, False) for a in sorted(direct, key=self._is_leaf)]
+        ops += [(a, True) for a in sorted(inverse, key=self._is_leaf)]
+
+        first, _ = ops.pop(0)
+        if not self._is_leaf(first):
+            self.emit(first, dest)
+        elif ops and self._is_leaf(ops[0][0]):
+            second, second_inv = ops.pop(0)
+            fn = inv_op if second_inv else op
+            self.lines.append(
+                f"{fn}({self.printer.doprint(first)}, {self.printer.doprint(second)}, out={dest})"
+            )
+        else:
+            self.lines.append(f"numpy.copyto({dest}, {self.printer.doprint(first)})")
+
+        for a, is_inv in ops:
+            self.accumulate(a, dest, inv_op if is_inv else op)
+
+    def _emit_pow(self, e: sp.Basic, dest: str) -> None:
+        base, exp = e.args
+        if self._is_leaf(exp):
+            src = self._operand(base, dest)
+            if exp == 2:
+                self.lines.append(f"numpy.square({src}, out={dest})")
+            elif exp == sp.S.Half:
+                self.lines.append(f"numpy.sqrt({src}, out={dest})")
+            elif exp == -1:
+                self.lines.append(f"numpy.divide(1.0, {src}, out={dest})")
+            else:
+                self.lines.append(f"numpy.power({src}, {self.printer.doprint(exp)}, out={dest})")
+        elif self._is_leaf(base):
+            src = self._operand(exp, dest)
+            self.lines.append(f"numpy.power({self.printer.doprint(base)}, {src}, out={dest})")
+        else:
+            self.emit(base, dest)
+            self.accumulate(exp, dest, "numpy.power")
+
+
+# ---------------------------------------------------------------------------
+# Parameter sweeps
+# ---------------------------------------------------------------------------
+
+_SWEEP_DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def _make_sweep(fn: Callable[..., Any], arg_names: Sequence[str]) -> Callable[..., np.ndarray]:
+    """Build the ``sweep`` method attached to every generated function."""
+
+    def sweep(
+        *args: Any,
+        swept: Union[str, int, Sequence[Union[str, int]]],
+        max_bytes: int = _SWEEP_DEFAULT_MAX_BYTES,
+    ) -> np.ndarray:
+        """Evaluate for many values of selected arguments, stacked along a new axis 0.
+
+        Parameters
+        ----------
+        *args:
+            Positional arguments as for the function itself. Each *swept* argument is
+            an array whose first axis enumerates the ``K`` candidates (row ``k`` of all
+            swept arguments forms candidate ``k``); the other arguments are used as-is
+            for every candidate (e.g. the sample grid ``x``).
+        swept:
+            Names or positions of the swept arguments.
+        max_bytes:
+            Memory budget for one chunk of results. Candidates are evaluated in chunks
+            of as many rows as fit, so temporaries stay bounded whatever ``K`` is.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(K, *S)``, where ``S`` is the broadcast shape of the
+            non-swept arguments and the trailing axes of the swept ones.
+        """
+        if len(args) != len(arg_names):
+            raise TypeError(f"sweep() expects {len(arg_names)} positional arguments ({', '.join(arg_names)}), got {len(args)}")
+        names = [swept] if isinstance(swept, (str, int)) else list(swept)
+        idx = []
+        for nm in names:
+            if isinstance(nm, str):
+                if nm not in arg_names:
+                    raise ValueError(f"sweep(): unknown argument {nm!r} (expected one of {', '.join(arg_names)})")
+                idx.append(arg_names.index(nm))
+            else:
+                idx.append(range(len(arg_names))[nm])
+        if not idx:
+            raise ValueError("sweep(): no swept arguments given")
+
+        arrays = [np.asarray(a) for a in args]
+        counts = {arrays[i].shape[0] if arrays[i].ndim else None for i in idx}
+        if None in counts or len(counts) != 1:
+            raise ValueError("sweep(): swept arguments must be arrays with the same length along axis 0")
+        (k_total,) = counts
+        shape = np.broadcast_shapes(
+            *(a.shape for j, a in enumerate(arrays) if j not in idx), *(arrays[i].shape[1:] for i in idx)
         )
+        row_bytes = 8 * max(1, int(np.prod(shape)))
+        rows = max(1, int(max_bytes) // row_bytes)
+
+        def chunk_args(lo: int, hi: int) -> list[Any]:
+            out = list(arrays)
+            for i in idx:
+                a = arrays[i][lo:hi]
+                # (m, *extra) -> (m, 1, ..., 1, *extra) so axis 0 lines up in front of shape.
+                out[i] = a.reshape((hi - lo,) + (1,) * (len(shape) - (a.ndim - 1)) + a.shape[1:])
+            return out
+
+        accepts_out = "out" in inspect.signature(fn).parameters
+        result: Optional[np.ndarray] = None
+        for lo in range(0, k_total, rows):
+            hi = min(lo + rows, k_total)
+            if accepts_out:
+                if result is None:
+                    result = np.empty((k_total, *shape))
+                fn(*chunk_args(lo, hi), out=result[lo:hi])
+                continue
+            values = np.asarray(fn(*chunk_args(lo, hi)))
+            if result is None:
+                result = np.empty((k_total, *shape), dtype=np.result_type(values, np.float64))
+            result[lo:hi] = values
+        return result if result is not None else np.empty((0, *shape))
 
-    return fn
+    return sweep
+
+
+# ---------------------------------------------------------------------------
+# Structure analysis
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=_TERM_CACHE_MAXSIZE)
+def _linear_decomposition_impl(
+    expr: sp.Basic, params: Tuple[sp.Symbol, ...], expand_definition: bool
+) -> Optional[Tuple[sp.Expr, Tuple[sp.Expr, ...]]]:
+    if expand_definition:
+        expr = _expand_termwise(expr)
+    param_set = set(params)
+    coeffs = []
+    for p in params:
+        d = sp.diff(expr, p)
+        if d.free_symbols & param_set or d.has(sp.Derivative):
+            return None
+        coeffs.append(d)
+    offset = expr.subs({p: 0 for p in params})
+    return cast(sp.Expr, offset), tuple(coeffs)
+
+
+def linear_decomposition(
+    expr: Any, params: Iterable[sp.Symbol], *, expand_definition: bool = True
+) -> Optional[Tuple[sp.Expr, Tuple[sp.Expr, ...]]]:
+    """Split ``expr`` as ``offset + sum_i params[i]*coeffs[i]`` if it is linear in ``params``.
+
+    Returns ``(offset, coeffs)`` (one coefficient expression per parameter, all free of
+    ``params``) or None if ``expr`` is not (affine-)linear in the parameters, e.g.
+    because of products of parameters or parameters inside functions. Results are
+    cached.
+
+    With ``expand_definition=True`` custom functions are expanded first, as in
+    :func:`numpify`, so parameters hidden inside definitions are seen.
+
+    Examples
+    --------
+    >>> x, a, b = sp.symbols("x a b")
+    >>> linear_decomposition(a * sp.sin(x) + b * x**2 + 1, (a, b))
+    (1, (sin(x), x**2))
+    >>> linear_decomposition(a * sp.sin(b * x), (a, b)) is None
+    True
+    """
+    return _linear_decomposition_impl(cast(sp.Basic, sp.sympify(expr)), tuple(params), expand_definition)
+
+
+# ---------------------------------------------------------------------------
+# Alternative backends
+# ---------------------------------------------------------------------------
+
+_BACKENDS = ("numpy", "numba", "numexpr")
+
+
+class _BackendUnsupported(Exception):
+    """Raised when an expression cannot be compiled with the requested backend."""
+
+
+def _warn_backend_fallback(backend: str, reason: str) -> None:
+    warnings.warn(
+        f"numpify(backend={backend!r}): {reason}; falling back to the NumPy backend.",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def _generate_numba(
+    expr: sp.Basic,
+    args_tuple: Tuple[sp.Symbol, ...],
+    sym_bindings: _SymBindings,
+    func_bindings: _FuncBindings,
+    *,
+    cse: bool,
+    workspace: bool,
+) -> Dict[str, Any]:
+    """Generate a scalar kernel for ``numba.vectorize`` plus a thin wrapper.
+
+    The kernel is printed with :mod:`math` functions and compiled (in
+    :func:`_link_generated`) to a ufunc, so the whole expression is evaluated in one
+    fused loop over the samples without temporaries. Bound symbols are passed to the
+    kernel as extra (broadcast) arguments.
+
+    Raises
+    ------
+    _BackendUnsupported
+        If numba is not installed, or the expression needs Python-level callables
+        (bound ``f_numpy`` functions) or functions :mod:`math` cannot express.
+    """
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        raise _BackendUnsupported("numba is not installed") from None
+    if not args_tuple or not expr.free_symbols:
+        raise _BackendUnsupported("constant expressions are not compiled to kernels")
+    bound_funcs = {app.func.__name__ for app in expr.atoms(sp.Function)} & func_bindings.keys()
+    if bound_funcs:
+        raise _BackendUnsupported("bound f_numpy functions cannot be called from a kernel: " + ", ".join(sorted(bound_funcs)))
+
+    printer = PythonCodePrinter(settings={"allow_unknown_functions": False})
+    arg_names = [a.name for a in args_tuple]
+    kernel_args = arg_names + sorted(sym_bindings.keys())
+    try:
+        cse_lines, reduced = _cse_split([expr], printer) if cse else ([], [expr])
+        expr_code = printer.doprint(reduced[0])
+    except PrintMethodNotImplementedError as e:
+        raise _BackendUnsupported(str(e).splitlines()[0]) from None
+
+    lines = [f"def _kernel({', '.join(kernel_args)}):", *cse_lines, f"    return {expr_code}", ""]
+    if workspace:
+        lines.append(f"def _generated({', '.join(arg_names)}, *, out=None):")
+    else:
+        lines.append(f"def _generated({', '.join(arg_names)}):")
+    for nm in arg_names:
+        lines.append(f"    {nm} = numpy.asarray({nm})")
+    for nm in sorted(sym_bindings.keys()):
+        lines.append(f"    {nm} = _sym_bindings[{nm!r}]")
+    call_args = ", ".join(kernel_args) + (", out=out" if workspace else "")
+    lines.append(f"    return _kernel({call_args})")
+    return {
+        "source": "\n".join(lines),
+        "expr_code": expr_code,
+        "backend": "numba",
+        "kernel_arity": len(kernel_args),
+        "fourier": None,
+        "workspace": False,
+    }
+
+
+class _NumExprCodePrinter(NumExprPrinter):
+    """Print the *inner* ``numexpr`` expression string, with constants as literals."""
+
+    def _print_NumberSymbol(self, expr: sp.Basic) -> str:
+        return repr(float(expr))
+
+    _print_Pi = _print_Exp1 = _print_EulerGamma = _print_GoldenRatio = _print_Catalan = _print_NumberSymbol
+
+
+def _numexpr_split(expr: sp.Basic, free: Iterable[sp.Basic]) -> Tuple[sp.Basic, list[Tuple[sp.Symbol, sp.Basic]]]:
+    """Replace maximal subtrees ``numexpr`` cannot evaluate by placeholder symbols.
+
+    Returns the rewritten expression and the ``(placeholder, subtree)`` pairs, in
+    order of first occurrence; identical subtrees share one placeholder.
+    """
+    supported_funcs = set(_NumExprCodePrinter._numexpr_functions)
+    names = sp.numbered_symbols("_ne", exclude=set(free))
+    placeholders: Dict[sp.Basic, sp.Symbol] = {}
+
+    def visit(e: sp.Basic) -> sp.Basic:
+        if isinstance(e, (sp.Symbol, sp.Number, sp.NumberSymbol)) or e is sp.I:
+            return e
+        if isinstance(e, (sp.Add, sp.Mul, sp.Pow)) or (
+            isinstance(e, sp.Function) and type(e).__name__ in supported_funcs
+        ):
+            return e.func(*(visit(arg) for arg in e.args), evaluate=False)
+        if e not in placeholders:
+            placeholders[e] = next(names)
+        return placeholders[e]
+
+    reduced = visit(expr)
+    return reduced, [(sym, sub) for sub, sym in placeholders.items()]
+
+
+def _generate_numexpr(
+    expr: sp.Basic,
+    args_tuple: Tuple[sp.Symbol, ...],
+    sym_bindings: _SymBindings,
+    *,
+    printer: NumPyPrinter,
+    vectorize: bool,
+    cse: bool,
+    workspace: bool,
+) -> Dict[str, Any]:
+    """Generate a wrapper around a single ``numexpr.evaluate`` call.
+
+    Subtrees ``numexpr`` has no equivalent for (bound ``f_numpy`` functions,
+    ``Piecewise``, special functions, ...) are evaluated with NumPy first and passed
+    to ``numexpr`` as precomputed operands (``_ne0``, ``_ne1``, ...). With ``cse=True``
+    common subexpressions are shared among those NumPy subtrees only; ``numexpr``
+    itself evaluates blockwise and needs no intermediates.
+
+    Raises
+    ------
+    _BackendUnsupported
+        If numexpr is not installed or no part of the expression can be evaluated by it.
+    """
+    try:
+        import numexpr  # noqa: F401
+    except ImportError:
+        raise _BackendUnsupported("numexpr is not installed") from None
+    if not args_tuple or not expr.free_symbols:
+        raise _BackendUnsupported("constant expressions are not compiled to kernels")
+    reduced, placeholders = _numexpr_split(expr, expr.free_symbols)
+    if isinstance(reduced, sp.Symbol) and placeholders:
+        raise _BackendUnsupported("no part of the expression is supported by numexpr")
+
+    arg_names = [a.name for a in args_tuple]
+    subtrees = [sub for _, sub in placeholders]
+    cse_lines, subtrees = _cse_split(subtrees, printer) if cse and subtrees else ([], subtrees)
+    # NumExprPrinter.doprint would wrap the string in evaluate(...); keep only the string.
+    expr_code = _NumExprCodePrinter()._print(reduced)
+    operands = sorted(s.name for s in reduced.free_symbols)
+
+    if workspace:
+        lines = [f"def _generated({', '.join(arg_names)}, *, out=None):"]
+    else:
+        lines = [f"def _generated({', '.join(arg_names)}):"]
+    for nm in arg_names:
+        lines.append(f"    {nm} = numpy.asarray({nm})")
+    for nm in sorted(sym_bindings.keys()):
+        lines.append(f"    {nm} = _sym_bindings[{nm!r}]")
+    lines.extend(cse_lines)
+    for (sym, _), sub in zip(placeholders, subtrees):
+        lines.append(f"    {sym.name} = {printer.doprint(sub)}")
+    local_dict = "{" + ", ".join(f"{nm!r}: {nm}" for nm in operands) + "}"
+    call = f"_numexpr.evaluate({expr_code!r}, local_dict={local_dict}" + (", out=out)" if workspace else ")")
+    # numexpr returns 0-d arrays for scalar inputs; unwrap them for scalar evaluation.
+    lines.append(f"    return {call}" + ("" if vectorize else "[()]"))
+    return {
+        "source": "\n".join(lines),
+        "expr_code": expr_code,
+        "backend": "numexpr",
+        "fourier": None,
+        "workspace": False,
+    }
+
+
+def _jit_kernel(kernel: Callable[..., Any], arity: int) -> Callable[..., Any]:
+    """Compile a scalar kernel to a float64 ufunc with :func:`numba.vectorize`."""
+    import numba
+
+    signature = "float64(" + ", ".join(["float64"] * arity) + ")"
+    try:
+        return cast(Callable[..., Any], numba.vectorize([signature])(kernel))
+    except Exception as e:  # numba raises several error types while typing/lowering
+        raise _BackendUnsupported(f"numba could not compile the kernel ({type(e).__name__})") from e
 
 
 def _normalize_args(expr: sp.Basic, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]]) -> Tuple[sp.Symbol, ...]:
@@ -372,7 +1317,8 @@ def _require_bound_unknown_functions(expr: sp.Basic, printer: NumPyPrinter, func
     """Ensure any *bare* printed function calls have runtime bindings."""
     missing: set[str] = set()
 
-    for app in expr.atoms(sp.Function):
+    # One application per function class decides how the class prints.
+    for app in {app.func: app for app in expr.atoms(sp.Function)}.values():
         name = app.func.__name__
         try:
             code = printer.doprint(app).strip()
@@ -398,18 +1344,53 @@ def _require_bound_unknown_functions(expr: sp.Basic, printer: NumPyPrinter, func
 _NUMPIFY_CACHE_MAXSIZE = 256
 
 
-def _freeze_value_marker(value: Any) -> tuple[str, Any]:
-    """Return a hashable marker for *value*.
+def _freeze_value_marker(value: Any, _active: Optional[set[int]] = None) -> tuple[Any, ...]:
+    """Return a hashable, content-aware marker for *value*.
 
-    We prefer using the value itself when it is hashable (stable semantics).
-    If it is unhashable (e.g. NumPy arrays, dicts), fall back to object identity.
+    Markers are equal when the values are interchangeable for the generated code:
 
-    Notes
-    -----
-    - Using ``id(value)`` means cache hits are session-local and depend on the
-      specific object instance. This is usually what you want for injected
-      constants like arrays.
+    - NumPy arrays: dtype, shape and a BLAKE2 digest of the contents, so equal arrays
+      share a cache entry regardless of which object holds them.
+    - Python functions: module, qualified name and globals namespace, plus the
+      bytecode, constants, defaults and closure contents (a redefinition with the
+      same code hits; a closure over different values does not).
+    - lists/tuples/dicts: markers of their items.
+    - other hashable values: the value itself.
+    - anything else: ``id(value)``. The cache key keeps a reference to the value,
+      so the id cannot be recycled while the entry is alive.
     """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return ("ID", id(value))
+        data = np.ascontiguousarray(value)
+        digest = hashlib.blake2b(memoryview(data).cast("B"), digest_size=16).digest()
+        return ("ND", data.dtype.str, data.shape, digest)
+
+    # Guard against self-referencing containers/closures (e.g. recursive functions).
+    active = set() if _active is None else _active
+    if id(value) in active:
+        return ("ID", id(value))
+    active.add(id(value))
+    try:
+        if isinstance(value, types.FunctionType):
+            closure = tuple(_freeze_value_marker(c.cell_contents, active) for c in (value.__closure__ or ()) if _cell_is_set(c))
+            defaults = _freeze_value_marker(value.__defaults__, active)
+            return (
+                "FN",
+                value.__module__,
+                value.__qualname__,
+                id(value.__globals__),
+                _code_marker(value.__code__),
+                defaults,
+                closure,
+            )
+        if isinstance(value, (list, tuple)):
+            return ("SEQ", type(value).__name__, tuple(_freeze_value_marker(v, active) for v in value))
+        if isinstance(value, dict):
+            return ("MAP", tuple((_freeze_value_marker(k, active), _freeze_value_marker(v, active)) for k, v in value.items()))
+    finally:
+        active.discard(id(value))
+
     try:
         hash(value)
     except Exception:
@@ -418,13 +1399,27 @@ def _freeze_value_marker(value: Any) -> tuple[str, Any]:
         return ("H", value)
 
 
+def _cell_is_set(cell: Any) -> bool:
+    try:
+        cell.cell_contents
+    except ValueError:  # empty cell (variable not yet assigned)
+        return False
+    return True
+
+
+def _code_marker(code: types.CodeType) -> tuple[Any, ...]:
+    """Hashable summary of a code object (nested code objects included)."""
+    consts = tuple(_code_marker(c) if isinstance(c, types.CodeType) else ("C", type(c).__name__, repr(c)) for c in code.co_consts)
+    return (code.co_code, code.co_names, consts)
+
+
 def _freeze_f_numpy_key(f_numpy: Optional[Mapping[_BindingKey, Any]]) -> tuple[tuple[Any, ...], ...]:
     """Normalize ``f_numpy`` to a hashable key for caching.
 
     The key is a sorted tuple of entries. Each entry includes:
 
     - a *normalized binding key* (symbol/function name identity)
-    - a *value marker* (hashable value when possible, otherwise ``id(value)``)
+    - a *value marker* (content fingerprint, see :func:`_freeze_value_marker`)
 
     This function is intentionally conservative: it aims to prevent incorrect
     cache hits when bindings differ.
@@ -456,8 +1451,8 @@ def _freeze_f_numpy_key(f_numpy: Optional[Mapping[_BindingKey, Any]]) -> tuple[t
 class _FrozenFNumPy:
     """Small hashable wrapper around an ``f_numpy`` mapping.
 
-    This exists solely so that :func:`functools.lru_cache` can cache compiled
-    callables even when the mapping contains unhashable values (like NumPy arrays).
+    This exists solely so that the compile cache can key compiled callables even
+    when the mapping contains unhashable values (like NumPy arrays).
 
     The cache key is derived from a normalized, hashable view of the mapping.
     """
@@ -475,30 +1470,367 @@ class _FrozenFNumPy:
         return isinstance(other, _FrozenFNumPy) and self._key == other._key
 
 
-@lru_cache(maxsize=_NUMPIFY_CACHE_MAXSIZE)
+# ---------------------------------------------------------------------------
+# Persistent (on-disk) cache
+# ---------------------------------------------------------------------------
+
+_DISK_CACHE_FORMAT = 2  # bump when the layout of generated entries changes
+_DISK_CACHE_DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def _default_disk_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gu_toolkit", "numpify")
+
+
+def _reachable_functions(expr: sp.Basic) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Collect user-defined function classes in ``expr`` and in their definitions.
+
+    Returns ``(classes, definitions)``: name -> function class, and name -> ``srepr``
+    of the symbolic definition on placeholder arguments (the unevaluated call for
+    opaque functions). The definitions make the cache key change when a function is
+    redefined, including functions that are only reachable through other definitions.
+    """
+    classes: Dict[str, Any] = {}
+    definitions: Dict[str, str] = {}
+    pending = [expr]
+    while pending:
+        for app in pending.pop().atoms(sp.Function):
+            cls = app.func
+            name = cls.__name__
+            if name in classes or (getattr(cls, "__module__", None) or "").startswith("sympy."):
+                continue
+            classes[name] = cls
+            placeholders = sp.symbols(f"_d0:{len(app.args)}")
+            definition = cast(sp.Basic, cls(*placeholders).rewrite("expand_definition"))
+            definitions[name] = sp.srepr(definition)
+            pending.append(definition)
+    return classes, definitions
+
+
+class _DiskCache:
+    """Generated-source store: one JSON file per compilation in ``directory``.
+
+    Entries hold the data produced by :func:`numpify` for :func:`_link_generated`
+    (never pickled functions). The directory is kept under ``max_bytes`` by deleting
+    the least recently used files (by modification time, refreshed on every hit).
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        expr: sp.Basic,
+        args_tuple: Tuple[sp.Symbol, ...],
+        frozen: _FrozenFNumPy,
+        definitions: Mapping[str, str],
+        options: Tuple[Tuple[str, Any], ...],
+    ) -> str:
+        # Only binding *names* enter the key: the generated source looks bindings up by
+        # name, and values are supplied again when the entry is linked.
+        payload = repr((
+            _DISK_CACHE_FORMAT,
+            sp.__version__,
+            sp.srepr(expr),
+            [a.name for a in args_tuple],
+            [k_norm for k_norm, _ in frozen._key],
+            sorted(definitions.items()),
+            options,
+        ))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                generated = json.load(fh)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return cast(Dict[str, Any], generated)
+
+    def store(self, key: str, generated: Mapping[str, Any]) -> None:
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(generated, fh)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("numpify disk cache: could not write %s (%s)", path, e)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+_disk_cache: Optional[_DiskCache] = None
+
+
+def enable_numpify_disk_cache(directory: Optional[str] = None, *, max_bytes: int = _DISK_CACHE_DEFAULT_MAX_BYTES) -> str:
+    """Persist :func:`numpify_cached` compilations across sessions.
+
+    On an in-memory cache miss, :func:`numpify_cached` first looks for previously
+    generated source on disk (keyed by a SHA-256 hash of ``srepr(expr)``, the argument
+    names, the binding names, the definitions of user functions and the options) and
+    only runs expansion/code generation if none is found.
+
+    Parameters
+    ----------
+    directory:
+        Cache directory. Defaults to ``$XDG_CACHE_HOME/gu_toolkit/numpify``
+        (``~/.cache/gu_toolkit/numpify``).
+    max_bytes:
+        Size bound of the directory; least recently used entries are deleted first.
+
+    Returns
+    -------
+    str
+        The cache directory in use.
+    """
+    global _disk_cache
+    _disk_cache = _DiskCache(directory or _default_disk_cache_dir(), max_bytes)
+    return _disk_cache.directory
+
+
+def disable_numpify_disk_cache() -> None:
+    """Stop reading and writing the persistent cache (files are kept)."""
+    global _disk_cache
+    _disk_cache = None
+
+
+def _link_from_disk(
+    generated: Mapping[str, Any], expr: sp.Basic, frozen: _FrozenFNumPy, classes: Mapping[str, Any]
+) -> Optional[Callable[..., Any]]:
+    """Rebuild a cached entry with the current bindings, or None if one is missing."""
+    t0 = time.perf_counter()
+    sym_bindings, func_bindings = _parse_bindings(expr, frozen.mapping)
+    for name in generated["func_names"]:
+        if name in func_bindings:
+            continue
+        impl = getattr(classes.get(name), "f_numpy", None)
+        if not callable(impl):
+            return None
+        func_bindings[name] = cast(Callable[..., Any], impl)
+    if generated["backend"] != "numpy":
+        try:
+            importlib.import_module(generated["backend"])
+        except ImportError:
+            return None
+    fn, t_dict_s, t_exec_s = _link_generated(generated, sym_bindings, func_bindings)
+    timings = {"disk_load": 1000.0 * (time.perf_counter() - t0), "dict": 1000.0 * t_dict_s, "exec": 1000.0 * t_exec_s}
+    setattr(fn, "_numpify_timings", timings)
+    return fn
+
+
+# ---------------------------------------------------------------------------
+# In-memory cache with statistics
+# ---------------------------------------------------------------------------
+
+
+class CacheInfo(NamedTuple):
+    """Aggregate counters, compatible with :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class NumpifyCacheEntry(NamedTuple):
+    """Statistics of one :func:`numpify_cached` entry (see ``numpify_cached.cache_stats()``)."""
+
+    expr: sp.Basic
+    args: Tuple[str, ...]
+    options: Dict[str, Any]
+    hits: int
+    last_used: float
+    """Wall-clock time (``time.time()``) of the last lookup."""
+    compile_ms: Dict[str, float]
+    """Phase timings of the compilation: ``expand``/``codegen``/``dict``/``exec``/``total``,
+    or ``disk_load``/``dict``/``exec`` for entries restored from the disk cache."""
+    source_bytes: int
+    pinned: bool
+
+
+class _CacheRecord:
+    __slots__ = ("fn", "hits", "last_used", "pinned")
+
+    def __init__(self, fn: Callable[..., Any]):
+        self.fn = fn
+        self.hits = 0
+        self.last_used = time.time()
+        self.pinned = False
+
+
+# Order of the option fields in cache keys (after expr, args and bindings).
+_CACHE_OPTIONS = ("vectorize", "expand_definition", "cse", "fourier", "workspace", "backend")
+
+
+class _NumpifyCache:
+    """LRU mapping ``key -> compiled function`` with per-entry statistics.
+
+    Unlike :func:`functools.lru_cache` this allows inspecting, pinning and evicting
+    individual entries. Pinned entries are never evicted by the LRU policy (so the
+    cache may exceed ``maxsize`` if everything is pinned). All methods hold ``_lock``.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records: OrderedDict[tuple[Any, ...], _CacheRecord] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...]) -> Optional[Callable[..., Any]]:
+        with _lock:
+            rec = self._records.get(key)
+            if rec is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            rec.hits += 1
+            rec.last_used = time.time()
+            self._records.move_to_end(key)
+            return rec.fn
+
+    def put(self, key: tuple[Any, ...], fn: Callable[..., Any]) -> None:
+        with _lock:
+            self._records[key] = _CacheRecord(fn)
+            self._records.move_to_end(key)
+            excess = len(self._records) - self.maxsize
+            if excess > 0:
+                for k in [k for k, r in self._records.items() if not r.pinned][:excess]:
+                    del self._records[k]
+
+    def matching(self, expr: sp.Basic, args: Optional[Tuple[sp.Symbol, ...]]) -> list[tuple[Any, ...]]:
+        with _lock:
+            return [k for k in self._records if k[0] == expr and (args is None or k[1] == args)]
+
+    def pin(self, keys: Iterable[tuple[Any, ...]], pinned: bool) -> None:
+        with _lock:
+            for key in keys:
+                if key in self._records:
+                    self._records[key].pinned = pinned
+
+    def evict(self, keys: Iterable[tuple[Any, ...]]) -> None:
+        with _lock:
+            for key in keys:
+                self._records.pop(key, None)
+
+    def info(self) -> CacheInfo:
+        with _lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._records))
+
+    def clear(self) -> None:
+        with _lock:
+            self._records.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> list[NumpifyCacheEntry]:
+        out = []
+        with _lock:
+            records = list(self._records.items())
+        for key, rec in records:
+            out.append(NumpifyCacheEntry(
+                expr=key[0],
+                args=tuple(a.name for a in key[1]),
+                options=dict(zip(_CACHE_OPTIONS, key[3:])),
+                hits=rec.hits,
+                last_used=rec.last_used,
+                compile_ms=dict(getattr(rec.fn, "_numpify_timings", {})),
+                source_bytes=len(getattr(rec.fn, "_generated_source", "")),
+                pinned=rec.pinned,
+            ))
+        return out
+
+
+_numpify_cache = _NumpifyCache(_NUMPIFY_CACHE_MAXSIZE)
+
+
 def _numpify_cached_impl(
     expr: sp.Basic,
     args_tuple: Tuple[sp.Symbol, ...],
     frozen: _FrozenFNumPy,
     vectorize: bool,
     expand_definition: bool,
+    cse: bool,
+    fourier: bool,
+    workspace: bool,
+    backend: str,
 ) -> Callable[..., Any]:
     # NOTE: This function body only runs on cache *misses*.
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            "numpify_cached: cache MISS (args=%s, vectorize=%s, expand_definition=%s)",
+            "numpify_cached: cache MISS (args=%s, vectorize=%s, expand_definition=%s, cse=%s, fourier=%s, workspace=%s, backend=%s)",
             [a.name for a in args_tuple],
             vectorize,
             expand_definition,
+            cse,
+            fourier,
+            workspace,
+            backend,
         )
+    disk = _disk_cache
+    disk_key: Optional[str] = None
+    if disk is not None:
+        try:
+            classes, definitions = _reachable_functions(expr)
+        except Exception:
+            # A definition that cannot be evaluated on placeholders: skip the disk cache.
+            classes, definitions = {}, None
+        if definitions is not None:
+            options = (
+                ("vectorize", vectorize),
+                ("expand_definition", expand_definition),
+                ("cse", cse),
+                ("fourier", fourier),
+                ("workspace", workspace),
+                ("backend", backend),
+            )
+            disk_key = disk.key(expr, args_tuple, frozen, definitions, options)
+            generated = disk.load(disk_key)
+            if generated is not None:
+                fn = _link_from_disk(generated, expr, frozen, classes)
+                if fn is not None:
+                    logger.debug("numpify_cached: disk cache HIT (%s)", disk_key[:12])
+                    return fn
+
     # Delegate to numpify() for actual compilation.
-    return numpify(
+    fn = numpify(
         expr,
         args=args_tuple,
         f_numpy=frozen.mapping,
         vectorize=vectorize,
         expand_definition=expand_definition,
+        cse=cse,
+        fourier=fourier,
+        workspace=workspace,
+        backend=backend,
     )
+    if disk is not None and disk_key is not None:
+        disk.store(disk_key, getattr(fn, "_numpify_generated"))
+    return fn
 
 
 def numpify_cached(
@@ -508,6 +1840,10 @@ def numpify_cached(
     f_numpy: Optional[Mapping[_BindingKey, Any]] = None,
     vectorize: bool = True,
     expand_definition: bool = True,
+    cse: bool = False,
+    fourier: bool = False,
+    workspace: bool = False,
+    backend: str = "numpy",
 ) -> Callable[..., Any]:
     """Cached version of :func:`numpify`.
 
@@ -521,11 +1857,12 @@ def numpify_cached(
     - the SymPy expression (after :func:`sympy.sympify`),
     - the normalized argument tuple ``args``,
     - a normalized, hashable view of ``f_numpy``,
-    - and the options ``vectorize`` / ``expand_definition``.
+    - and the options ``vectorize`` / ``expand_definition`` / ``cse`` / ``fourier`` /
+      ``workspace`` / ``backend``.
 
     Parameters
     ----------
-    expr, args, f_numpy, vectorize, expand_definition:
+    expr, args, f_numpy, vectorize, expand_definition, cse, fourier, workspace, backend:
         Same meaning as in :func:`numpify`.
 
     Returns
@@ -535,11 +1872,21 @@ def numpify_cached(
 
     Notes
     -----
-    - If you mutate objects referenced by ``f_numpy`` (e.g. change entries of a
-      NumPy array), cached callables will see the mutated object because the
-      compiled function captures the object by reference.
+    - Binding values are keyed by content (arrays by dtype/shape/digest, Python
+      functions by name and code), so equal bindings share one compilation. The
+      returned function is linked to the objects passed in ``f_numpy`` (callers
+      passing other, equal objects get their own relinked copy of the function, and
+      the shared function is never modified); if you later mutate them (e.g. change
+      entries of a NumPy array), the callable sees the mutated object because it
+      captures the object by reference.
     - If you need a fresh compile, call :func:`numpify` directly or clear the
       cache via ``numpify_cached.cache_clear()``.
+    - Introspection: ``numpify_cached.cache_info()`` (aggregate counters),
+      ``numpify_cached.cache_stats()`` (per-entry hits, last use, compile timings,
+      source size), ``numpify_cached.cache_pin(expr)`` (exempt from LRU eviction)
+      and ``numpify_cached.cache_evict(expr)``.
+    - After :func:`enable_numpify_disk_cache`, in-memory misses are first looked up
+      in the persistent cache, so compilations survive kernel restarts.
     """
     # Normalize to SymPy and args tuple exactly as numpify() does.
     expr_sym = cast(sp.Basic, sp.sympify(expr))
@@ -549,9 +1896,209 @@ def numpify_cached(
     args_tuple = _normalize_args(expr_sym, args)
     frozen = _FrozenFNumPy(f_numpy)
 
-    return _numpify_cached_impl(expr_sym, args_tuple, frozen, vectorize, expand_definition)
+    key = (expr_sym, args_tuple, frozen, vectorize, expand_definition, cse, fourier, workspace, backend)
+    fn = _numpify_cache.get(key)
+    if fn is None:
+        fn = _numpify_cached_impl(*key)
+        _numpify_cache.put(key, fn)
+    if frozen.mapping:
+        fn = _relinked(fn, frozen.mapping)
+    return fn
+
+
+_RELINKED_MAXSIZE = 8  # relinked copies kept per cached function
+
+
+def _relinked(fn: Callable[..., Any], mapping: Mapping[_BindingKey, Any]) -> Callable[..., Any]:
+    """Return ``fn`` linked to the binding objects passed by the current caller.
+
+    A hit only guarantees *equal* bindings (see :func:`_freeze_value_marker`). If the
+    caller's objects are not the ones ``fn`` was linked to, a copy of ``fn`` with its
+    own globals is returned (and remembered per object identity), so callers never
+    re-point each other's functions.
+    """
+    glb = getattr(fn, "__globals__", None)
+    if glb is None or "_sym_bindings" not in glb:
+        return fn
+    sym_updates: Dict[str, Any] = {}
+    func_updates: Dict[str, Any] = {}
+    for key, value in mapping.items():
+        if isinstance(key, sp.Symbol):
+            if glb["_sym_bindings"].get(key.name) is not value:
+                sym_updates[key.name] = value
+        else:
+            name = key.func.__name__ if isinstance(key, sp.Function) else key.__name__
+            if name in glb and glb[name] is not value:
+                func_updates[name] = value
+    if not sym_updates and not func_updates:
+        return fn
+
+    # The entry keeps the objects alive, so their ids identify them.
+    identity = (
+        tuple(sorted((name, id(v)) for name, v in sym_updates.items())),
+        tuple(sorted((name, id(v)) for name, v in func_updates.items())),
+    )
+    with _lock:
+        copies = fn.__dict__.setdefault("_numpify_relinked", OrderedDict())
+        entry = copies.get(identity)
+        if entry is not None:
+            copies.move_to_end(identity)
+            return entry[1]
+
+    new_glb = dict(glb)
+    new_glb["_sym_bindings"] = {**glb["_sym_bindings"], **sym_updates}
+    new_glb.update(func_updates)
+    if "_workspace" in glb:
+        new_glb["_workspace"] = _Workspace()  # scratch buffers are per function
+    new = types.FunctionType(fn.__code__, new_glb, fn.__name__, fn.__defaults__, fn.__closure__)
+    new.__kwdefaults__ = fn.__kwdefaults__
+    new.__doc__ = fn.__doc__
+    new.__dict__.update((k, v) for k, v in fn.__dict__.items() if k != "_numpify_relinked")
+    generated = getattr(fn, "_numpify_generated", None)
+    if generated is not None:
+        setattr(new, "sweep", _make_sweep(new, generated["arg_names"]))
+
+    with _lock:
+        entry = copies.setdefault(identity, ((sym_updates, func_updates), new))
+        copies.move_to_end(identity)
+        while len(copies) > _RELINKED_MAXSIZE:
+            copies.popitem(last=False)
+    return entry[1]
+
+
+def _cache_lookup_keys(expr: Any, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]]) -> list[tuple[Any, ...]]:
+    expr_sym = cast(sp.Basic, sp.sympify(expr))
+    args_tuple = None if args is None else _normalize_args(expr_sym, args)
+    return _numpify_cache.matching(expr_sym, args_tuple)
+
+
+def _cache_stats() -> list[NumpifyCacheEntry]:
+    """Return per-entry statistics, least recently used first.
+
+    Each :class:`NumpifyCacheEntry` reports the expression, argument names, options,
+    hit count, last-used time, compile timings (ms) and generated source size. Use
+    this to find expressions that are recompiled often or dominate compile time.
+    """
+    return _numpify_cache.stats()
+
+
+def _cache_pin(expr: Any, *, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]] = None, pinned: bool = True) -> int:
+    """Pin (or unpin) the cached entries for ``expr`` so LRU eviction skips them.
+
+    If ``args`` is given, only entries compiled with these arguments are affected.
+    Returns the number of entries changed.
+    """
+    keys = _cache_lookup_keys(expr, args)
+    _numpify_cache.pin(keys, pinned)
+    return len(keys)
+
+
+def _cache_evict(expr: Any, *, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]] = None) -> int:
+    """Remove the cached entries for ``expr`` (optionally only those with ``args``).
+
+    Pinned entries are removed as well. Returns the number of entries removed.
+    """
+    keys = _cache_lookup_keys(expr, args)
+    _numpify_cache.evict(keys)
+    return len(keys)
 
 
 # Expose cache controls on the public wrapper.
-numpify_cached.cache_info = _numpify_cached_impl.cache_info  # type: ignore[attr-defined]
-numpify_cached.cache_clear = _numpify_cached_impl.cache_clear  # type: ignore[attr-defined]
+numpify_cached.cache_info = _numpify_cache.info  # type: ignore[attr-defined]
+numpify_cached.cache_clear = _numpify_cache.clear  # type: ignore[attr-defined]
+numpify_cached.cache_stats = _cache_stats  # type: ignore[attr-defined]
+numpify_cached.cache_pin = _cache_pin  # type: ignore[attr-defined]
+numpify_cached.cache_evict = _cache_evict  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# Compiled-kernel handles
+# ---------------------------------------------------------------------------
+
+class NumpifyHandle:
+    """A compiled kernel for one expression, resolved once and then called directly.
+
+    Even on a cache hit, :func:`numpify_cached` sympifies the expression, normalizes
+    ``args`` and hashes the whole key (including the expression tree) on every call.
+    Code that evaluates the same expression on every slider tick should create a
+    handle once instead: it compiles on first use (through :func:`numpify_cached`, so
+    equal expressions still share one compilation) and afterwards only forwards the
+    call. The compiled function is dropped when the expression changes
+    (:meth:`set_expr`) or on :meth:`invalidate`.
+
+    Parameters
+    ----------
+    expr:
+        SymPy expression (or anything :func:`sympy.sympify` accepts).
+    args:
+        Argument symbols, as in :func:`numpify`.
+    **options:
+        Further :func:`numpify_cached` options (``cse``, ``workspace``, ``backend``, ...).
+
+    Examples
+    --------
+    >>> x, a = sp.symbols("x a")
+    >>> h = NumpifyHandle(a * x**2, args=[x, a])
+    >>> h.compiled
+    False
+    >>> float(h(3.0, 2.0))
+    18.0
+    >>> h.set_expr(a * x**3)
+    >>> h.compiled, float(h(3.0, 2.0))
+    (False, 54.0)
+    """
+
+    __slots__ = ("_expr", "_args", "_options", "_fn")
+
+    def __init__(self, expr: Any, *, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]] = None, **options: Any) -> None:
+        self._expr = sp.sympify(expr)
+        self._args = _freeze_args(args)
+        self._options = options
+        self._fn: Optional[Callable[..., Any]] = None
+
+    @property
+    def expr(self) -> sp.Basic:
+        return self._expr
+
+    @property
+    def args(self) -> Optional[Union[sp.Symbol, Tuple[sp.Symbol, ...]]]:
+        return self._args
+
+    @property
+    def compiled(self) -> bool:
+        """True once the kernel has been compiled (or fetched from the cache)."""
+        return self._fn is not None
+
+    @property
+    def function(self) -> Callable[..., Any]:
+        """The compiled function (compiled now if necessary)."""
+        if self._fn is None:
+            self._fn = numpify_cached(self._expr, args=self._args, **self._options)
+        return self._fn
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        fn = self._fn
+        if fn is None:
+            fn = self.function
+        return fn(*args, **kwargs)
+
+    def set_expr(self, expr: Any, *, args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]] = None) -> None:
+        """Replace the expression (and optionally ``args``); recompiles lazily if they changed."""
+        expr = sp.sympify(expr)
+        new_args = self._args if args is None else _freeze_args(args)
+        if expr != self._expr or new_args != self._args:
+            self._expr, self._args = expr, new_args
+            self._fn = None
+
+    def invalidate(self) -> None:
+        """Drop the compiled function; the next call compiles (or hits the cache) again."""
+        self._fn = None
+
+    def __repr__(self) -> str:
+        return f"NumpifyHandle({self._expr}, args={self._args}, compiled={self.compiled})"
+
+
+def _freeze_args(args: Optional[Union[sp.Symbol, Iterable[sp.Symbol]]]) -> Optional[Union[sp.Symbol, Tuple[sp.Symbol, ...]]]:
+    if args is None or isinstance(args, sp.Basic):
+        return args
+    return tuple(args)